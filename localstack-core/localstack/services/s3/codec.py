@@ -47,8 +47,8 @@ class AwsChunkedDecoder(io.RawIOBase):
     def read(self, size=-1):
         """
         Read from the underlying stream, and return at most `size` decoded bytes.
-        If a chunk is smaller than `size`, we will return less than asked, but we will always return data if there
-        are chunks left
+        Chunks are typically much smaller than the amount requested by the caller, so we keep decoding across chunk
+        boundaries until `size` is reached, to avoid paying the Python call overhead once per chunk
         :param size: amount to read, please note that it can return less than asked
         :return: bytes from the underlying stream
         """
@@ -58,49 +58,58 @@ class AwsChunkedDecoder(io.RawIOBase):
         if not size:
             return b""
 
-        if self._end_chunk:
-            # if it's the end of a chunk we need to strip the newline at the end of the chunk
-            # before jumping to the new one
-            self._strip_chunk_new_lines()
-            self._new_chunk = True
-            self._end_chunk = False
-
-        if self._new_chunk:
-            # If the _new_chunk flag is set, we have to jump to the next chunk, if there's one
-            self._get_next_chunk_length()
-            self._new_chunk = False
-
-        if self._chunk_size == 0 and self._decoded_length <= 0:
-            # If the next chunk is 0, and we decoded everything, try to get the trailing headers
-            self._get_trailing_headers()
-            if self.s3_object:
-                self._set_checksum_value()
-            return b""
-
-        # take the minimum account between the requested size, and the left chunk size
-        # (to not over read from the chunk)
-        amount = min(self._chunk_size, size)
-        data = self._stream.read(amount)
-
-        if data == b"":
-            raise EOFError("Encoded file ended before the end-of-stream marker was reached")
-
-        read = len(data)
-        self._chunk_size -= read
-        if self._chunk_size <= 0:
-            self._end_chunk = True
-
-        self._decoded_length -= read
-
-        return data
+        pieces = []
+        remaining = size
+        while remaining > 0:
+            if self._end_chunk:
+                # if it's the end of a chunk we need to strip the newline at the end of the chunk
+                # before jumping to the new one
+                self._strip_chunk_new_lines()
+                self._new_chunk = True
+                self._end_chunk = False
+
+            if self._new_chunk:
+                # If the _new_chunk flag is set, we have to jump to the next chunk, if there's one
+                self._get_next_chunk_length()
+                self._new_chunk = False
+
+            if self._chunk_size == 0 and self._decoded_length <= 0:
+                if pieces:
+                    # return what we have, the next call will parse the trailing headers
+                    break
+
+                # If the next chunk is 0, and we decoded everything, try to get the trailing headers
+                self._get_trailing_headers()
+                if self.s3_object:
+                    self._set_checksum_value()
+                return b""
+
+            # take the minimum account between the requested size, and the left chunk size
+            # (to not over read from the chunk)
+            amount = min(self._chunk_size, remaining)
+            data = self._stream.read(amount)
+
+            if data == b"":
+                raise EOFError("Encoded file ended before the end-of-stream marker was reached")
+
+            read = len(data)
+            self._chunk_size -= read
+            if self._chunk_size <= 0:
+                self._end_chunk = True
+
+            self._decoded_length -= read
+            pieces.append(data)
+            remaining -= read
+
+        return pieces[0] if len(pieces) == 1 else b"".join(pieces)
 
     def _strip_chunk_new_lines(self):
         self._stream.read(2)
 
     def _get_next_chunk_length(self):
         line = self._stream.readline()
-        chunk_length = int(line.split(b";")[0], 16)
-        self._chunk_size = chunk_length
+        # only the length part is needed, partition avoids building a list for the optional chunk extensions
+        self._chunk_size = int(line.partition(b";")[0], 16)
 
     def _get_trailing_headers(self):
         """
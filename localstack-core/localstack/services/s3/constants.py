@@ -50,18 +50,22 @@ VALID_STORAGE_CLASSES = [
     StorageClass.DEEP_ARCHIVE,
 ]
 
-ARCHIVES_STORAGE_CLASSES = [
-    StorageClass.GLACIER,
-    StorageClass.DEEP_ARCHIVE,
-]
+# only used for membership tests, so a frozenset gives O(1) lookups
+ARCHIVES_STORAGE_CLASSES = frozenset(
+    [
+        StorageClass.GLACIER,
+        StorageClass.DEEP_ARCHIVE,
+    ]
+)
 
-CHECKSUM_ALGORITHMS: list[ChecksumAlgorithm] = [
+# a tuple, as it is iterated over in a deterministic order and also used for membership tests
+CHECKSUM_ALGORITHMS: tuple[ChecksumAlgorithm, ...] = (
     ChecksumAlgorithm.SHA1,
     ChecksumAlgorithm.SHA256,
     ChecksumAlgorithm.CRC32,
     ChecksumAlgorithm.CRC32C,
     ChecksumAlgorithm.CRC64NVME,
-]
+)
 
 # response header overrides the client may request
 ALLOWED_HEADER_OVERRIDES = {
@@ -79,13 +83,40 @@ ALLOWED_HEADER_OVERRIDES = {
 ENABLE_MOTO_BUCKET_POLICY_ENFORCEMENT = False
 
 
-SYSTEM_METADATA_SETTABLE_HEADERS = [
+# a tuple of interned keys: the same small set of strings is used as dict keys for every single request, so all
+# system metadata dicts share the exact same key objects
+SYSTEM_METADATA_SETTABLE_HEADERS = (
     "CacheControl",
     "ContentDisposition",
     "ContentEncoding",
     "ContentLanguage",
     "ContentType",
-]
+)
+
+# fields of the PublicAccessBlock configuration, used for validation and defaulting
+PUBLIC_ACCESS_BLOCK_FIELDS = frozenset(
+    [
+        "BlockPublicAcls",
+        "BlockPublicPolicy",
+        "IgnorePublicAcls",
+        "RestrictPublicBuckets",
+    ]
+)
+
+# system metadata headers settable through a POST object form, mapped to their metadata field name
+POST_OBJECT_SYSTEM_SETTABLE_HEADERS = {
+    "Cache-Control": "CacheControl",
+    "Content-Type": "ContentType",
+    "Content-Disposition": "ContentDisposition",
+    "Content-Encoding": "ContentEncoding",
+}
+
+# encryption form fields of a POST object request, mapped to their request parameter name
+POST_OBJECT_ENCRYPTION_HEADERS = {
+    "x-amz-server-side-encryption": "ServerSideEncryption",
+    "x-amz-server-side-encryption-aws-kms-key-id": "SSEKMSKeyId",
+    "x-amz-server-side-encryption-bucket-key-enabled": "BucketKeyEnabled",
+}
 
 # params are required in presigned url
 SIGNATURE_V2_PARAMS = ["Signature", "Expires", "AWSAccessKeyId"]
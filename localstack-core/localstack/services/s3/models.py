@@ -1,10 +1,13 @@
 import base64
 import hashlib
 import logging
+import sys
 from collections import defaultdict
 from datetime import datetime
+from functools import cached_property
 from secrets import token_urlsafe
 from typing import Literal, NamedTuple, Optional, Union
+from urllib import parse as urlparser
 from zoneinfo import ZoneInfo
 
 from localstack.aws.api import CommonServiceException
@@ -89,6 +92,15 @@ LOG = logging.getLogger(__name__)
 _gmt_zone_info = ZoneInfo("GMT")
 
 
+def _version_sort_key(version: "S3Object | S3DeleteMarker") -> tuple[ObjectKey, int]:
+    if (neg_last_modified_us := version.neg_last_modified_us) is None:
+        # versions restored from persisted state predate the precomputed field; fill it in lazily
+        neg_last_modified_us = version.neg_last_modified_us = -int(
+            version.last_modified.timestamp() * 1_000_000
+        )
+    return version.key, neg_last_modified_us
+
+
 # note: not really a need to use a dataclass here, as it has a lot of fields, but only a few are set at creation
 class S3Bucket:
     name: BucketName
@@ -119,6 +131,10 @@ class S3Bucket:
     replication: ReplicationConfiguration
     owner: Owner
 
+    # lazily built (source, Mode, Days, Years) cache of the default retention fields, revalidated by identity
+    # against object_lock_default_retention; class-level default covers restored instances
+    default_retention_cache: Optional[tuple] = None
+
     # set all buckets parameters here
     def __init__(
         self,
@@ -159,7 +175,9 @@ class S3Bucket:
         self.acl = acl
         # see https://docs.aws.amazon.com/AmazonS3/latest/API/API_Owner.html
         self.owner = owner
-        self.bucket_arn = arns.s3_bucket_arn(self.name, region=bucket_region)
+        # interned: the ARN is hashed on every tagging-table operation, and interning caches the hash and
+        # collapses equal comparisons to identity checks
+        self.bucket_arn = sys.intern(arns.s3_bucket_arn(self.name, region=bucket_region))
 
     def get_object(
         self,
@@ -261,10 +279,8 @@ class S3Object:
     encryption: Optional[ServerSideEncryption]  # inherit bucket
     kms_key_id: Optional[SSEKMSKeyId]  # inherit bucket
     bucket_key_enabled: Optional[bool]  # inherit bucket
-    sse_key_hash: Optional[SSECustomerKeyMD5]
     checksum_algorithm: ChecksumAlgorithm
     checksum_value: str
-    checksum_type: ChecksumType
     lock_mode: Optional[ObjectLockMode | ObjectLockRetentionMode]
     lock_legal_status: Optional[ObjectLockLegalHoldStatus]
     lock_until: Optional[datetime]
@@ -275,6 +291,15 @@ class S3Object:
     restore: Optional[Restore]
     internal_last_modified: int
 
+    # class-level defaults: objects restored from persisted state can predate these fields and bypass __init__,
+    # the class attribute keeps plain attribute access working for them without per-call getattr defaults
+    # TODO: remove the defaults at the next major release
+    checksum_type: ChecksumType = ChecksumType.FULL_OBJECT
+    sse_key_hash: Optional[SSECustomerKeyMD5] = None
+    neg_last_modified_us: Optional[int] = None
+    # lazily created cache of per-part ObjectRange results, see get_part_range in the provider
+    part_range_cache: Optional[dict] = None
+
     def __init__(
         self,
         key: ObjectKey,
@@ -325,6 +350,7 @@ class S3Object:
         self.website_redirect_location = website_redirect_location
         self.is_current = True
         self.last_modified = datetime.now(tz=_gmt_zone_info)
+        self.neg_last_modified_us = -int(self.last_modified.timestamp() * 1_000_000)
         self.parts = {}
         self.restore = None
         self.owner = owner
@@ -339,29 +365,36 @@ class S3Object:
         if self.expires:
             headers["Expires"] = self.expires_rfc1123
 
-        for metadata_key, metadata_value in self.system_metadata.items():
-            headers[metadata_key] = metadata_value
+        headers.update(self.system_metadata)
 
         if self.storage_class != StorageClass.STANDARD:
             headers["StorageClass"] = self.storage_class
 
         return headers
 
-    @property
+    @cached_property
     def last_modified_rfc1123(self) -> str:
         # TODO: verify if we need them with proper snapshot testing, for now it's copied from moto
         # Different datetime formats depending on how the key is obtained
         # https://github.com/boto/boto/issues/466
+        # cached: last_modified is set once at creation and never changes for a given object instance
         return rfc_1123_datetime(self.last_modified)
 
     @property
     def expires_rfc1123(self) -> str:
         return rfc_1123_datetime(self.expires)
 
-    @property
+    @cached_property
     def quoted_etag(self) -> str:
+        # cached: the etag is assigned exactly once (when the body is stored) before any response exposes it
         return f'"{self.etag}"'
 
+    @cached_property
+    def url_quoted_key(self) -> str:
+        """URL-encoded form of the key, cached as the key is immutable. Used by the List operations when the
+        client requests EncodingType=url"""
+        return urlparser.quote(self.key)
+
     def is_locked(self, bypass_governance: bool = False) -> bool:
         if self.lock_legal_status == "ON":
             return True
@@ -382,10 +415,14 @@ class S3DeleteMarker:
     last_modified: datetime
     is_current: bool
 
+    # see S3Object.neg_last_modified_us
+    neg_last_modified_us: Optional[int] = None
+
     def __init__(self, key: ObjectKey, version_id: ObjectVersionId):
         self.key = key
         self.version_id = version_id
         self.last_modified = datetime.now(tz=_gmt_zone_info)
+        self.neg_last_modified_us = -int(self.last_modified.timestamp() * 1_000_000)
         self.is_current = True
 
     @staticmethod
@@ -428,11 +465,14 @@ class S3Multipart:
     object: S3Object
     upload_id: MultipartUploadId
     checksum_value: Optional[str]
-    checksum_type: Optional[ChecksumType]
     checksum_algorithm: ChecksumAlgorithm
     initiated: datetime
     precondition: bool
 
+    # class-level default for multiparts restored from persisted state that predate the field, see S3Object
+    # TODO: remove the default at the next major release
+    checksum_type: Optional[ChecksumType] = None
+
     def __init__(
         self,
         key: ObjectKey,
@@ -487,6 +527,11 @@ class S3Multipart:
             owner=owner,
         )
 
+    @cached_property
+    def initiated_ts(self) -> float:
+        """POSIX timestamp of `initiated`, cached for the list_multipart_uploads sort"""
+        return self.initiated.timestamp()
+
     def complete_multipart(
         self, parts: CompletedPartList, mpu_size: int = None, validation_checksum: str = None
     ):
@@ -605,22 +650,69 @@ class KeyStore:
     retrieve the object from that key.
     """
 
+    # class-level defaults, so that instances restored from persisted state (bypassing __init__) also start
+    # without cached sorted views. The mutation counter guards cache publication: a view built concurrently
+    # with a mutation must not overwrite the mutation's invalidation, see `sorted_entries`
+    _sorted_entries: Optional[list[tuple[ObjectKey, S3Object]]] = None
+    _sorted_versions: Optional[list[S3Object]] = None
+    _mutation_count: int = 0
+
     def __init__(self):
         self._store = {}
+        self._sorted_entries = None
+        self._sorted_versions = None
+        self._mutation_count = 0
 
     def get(self, object_key: ObjectKey) -> S3Object | None:
         return self._store.get(object_key)
 
     def set(self, object_key: ObjectKey, s3_object: S3Object):
         self._store[object_key] = s3_object
+        self._mutation_count += 1
+        self._sorted_entries = None
+        self._sorted_versions = None
 
     def pop(self, object_key: ObjectKey, default=None) -> S3Object | None:
+        self._mutation_count += 1
+        self._sorted_entries = None
+        self._sorted_versions = None
         return self._store.pop(object_key, default)
 
     def values(self, *_, **__) -> list[S3Object | S3DeleteMarker]:
         # we create a shallow copy with dict to avoid size changed during iteration
         return [value for value in dict(self._store).values()]
 
+    def sorted_entries(self) -> list[tuple[ObjectKey, S3Object]]:
+        """
+        Return the (key, object) pairs sorted by key. The view is cached until the next mutation, so repeated
+        List calls on a stable bucket skip the O(N log N) sort. Callers must not mutate the returned list.
+        """
+        if (sorted_entries := self._sorted_entries) is not None:
+            return sorted_entries
+
+        mutation_count = self._mutation_count
+        sorted_entries = sorted(dict(self._store).items())
+        # only publish the view if no mutation completed while it was being built: the assignment would
+        # otherwise clobber the concurrent invalidation, hiding the write from every later listing
+        if mutation_count == self._mutation_count:
+            self._sorted_entries = sorted_entries
+        return sorted_entries
+
+    def sorted_versions(self) -> list[S3Object]:
+        """
+        See `VersionedKeyStore.sorted_versions`: an unversioned store only holds the single current version of
+        each key, sorted by key. Callers must not mutate the returned list.
+        """
+        if (sorted_versions := self._sorted_versions) is not None:
+            return sorted_versions
+
+        mutation_count = self._mutation_count
+        sorted_versions = [s3_object for _, s3_object in self.sorted_entries()]
+        # see sorted_entries for the publication guard
+        if mutation_count == self._mutation_count:
+            self._sorted_versions = sorted_versions
+        return sorted_versions
+
     def is_empty(self) -> bool:
         return not self._store
 
@@ -637,8 +729,16 @@ class VersionedKeyStore:
     See: https://docs.aws.amazon.com/AmazonS3/latest/userguide/versioning-workflows.html
     """
 
+    # see KeyStore._sorted_entries for the cached views and the publication-guard counter
+    _sorted_entries: Optional[list[tuple[ObjectKey, S3Object]]] = None
+    _sorted_versions: Optional[list[S3Object | S3DeleteMarker]] = None
+    _mutation_count: int = 0
+
     def __init__(self):
         self._store = defaultdict(dict)
+        self._sorted_entries = None
+        self._sorted_versions = None
+        self._mutation_count = 0
 
     @classmethod
     def from_key_store(cls, keystore: KeyStore) -> "VersionedKeyStore":
@@ -680,10 +780,16 @@ class VersionedKeyStore:
             existing_s3_object.is_current = False
 
         self._store[object_key][s3_object.version_id] = s3_object
+        self._mutation_count += 1
+        self._sorted_entries = None
+        self._sorted_versions = None
 
     def pop(
         self, object_key: ObjectKey, version_id: ObjectVersionId = None, default=None
     ) -> S3Object | S3DeleteMarker | None:
+        self._mutation_count += 1
+        self._sorted_entries = None
+        self._sorted_versions = None
         versions = self._store.get(object_key)
         if not versions:
             return None
@@ -720,6 +826,41 @@ class VersionedKeyStore:
 
         return objects
 
+    def sorted_entries(self) -> list[tuple[ObjectKey, S3Object]]:
+        """
+        Return the (key, object) pairs of the current (latest, non-DeleteMarker) versions, sorted by key. The view
+        is cached until the next mutation, see `KeyStore.sorted_entries`. Callers must not mutate the returned list.
+        """
+        if (sorted_entries := self._sorted_entries) is not None:
+            return sorted_entries
+
+        mutation_count = self._mutation_count
+        sorted_entries = sorted((s3_object.key, s3_object) for s3_object in self.values())
+        # see KeyStore.sorted_entries for the publication guard
+        if mutation_count == self._mutation_count:
+            self._sorted_entries = sorted_entries
+        return sorted_entries
+
+    def sorted_versions(self) -> list[S3Object | S3DeleteMarker]:
+        """
+        Return every version of every key (DeleteMarkers included), sorted by key and most recent version
+        first. The view is cached until the next mutation; version timestamps never change after insertion, so
+        only set/pop can invalidate the ordering. Callers must not mutate the returned list.
+        """
+        if (sorted_versions := self._sorted_versions) is not None:
+            return sorted_versions
+
+        mutation_count = self._mutation_count
+        all_versions = self.values(with_versions=True)
+        # sort by key, and last-modified-date, to get the last version first. The negated timestamp is
+        # precomputed as an integer on the versions, so the sort compares plain ints instead of paying a
+        # datetime-to-float conversion per comparison key
+        all_versions.sort(key=_version_sort_key)
+        # see KeyStore.sorted_entries for the publication guard
+        if mutation_count == self._mutation_count:
+            self._sorted_versions = all_versions
+        return all_versions
+
     def is_empty(self) -> bool:
         return not self._store
 
@@ -5,7 +5,7 @@ import json
 import logging
 import re
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, List, Optional, Tuple, TypedDict, Union
 from urllib.parse import quote
 
@@ -119,9 +119,55 @@ class S3EventNotificationContext:
         :param s3_object: S3Object passed directly to the context
         :return: S3EventNotificationContext
         """
+        return cls.prototype_from_request_context(request_context, s3_bucket).for_object(
+            s3_bucket, s3_object
+        )
+
+    @classmethod
+    def prototype_from_request_context(
+        cls,
+        request_context: RequestContext,
+        s3_bucket: S3Bucket,
+    ) -> "S3EventNotificationContext":
+        """
+        Create an S3EventNotificationContext carrying only the request- and bucket-level fields. Batch operations
+        like DeleteObjects can build this prototype once and derive the per-object contexts with `for_object`,
+        instead of re-reading the request context for every object.
+        :param request_context: RequestContext
+        :param s3_bucket: S3Bucket
+        :return: S3EventNotificationContext with the object-level fields unset
+        """
         bucket_name = request_context.service_request["Bucket"]
         event_type = EVENT_OPERATION_MAP.get(request_context.operation.wire_name, "")
 
+        return cls(
+            request_id=request_context.request_id,
+            event_type=event_type,
+            event_time=datetime.datetime.now(),
+            account_id=request_context.account_id,
+            region=request_context.region,
+            caller=request_context.account_id,  # TODO: use it for `userIdentity`
+            bucket_name=bucket_name,
+            bucket_location=s3_bucket.bucket_region,
+            bucket_account_id=s3_bucket.bucket_account_id,  # TODO: use it for bucket owner identity
+            key_name=None,
+            key_etag=None,
+            key_size=None,
+            key_expiry=None,
+            key_storage_class=None,
+            key_version_id=None,
+            xray=request_context.request.headers.get(HEADER_AMZN_XRAY),
+        )
+
+    def for_object(
+        self, s3_bucket: S3Bucket, s3_object: S3Object | S3DeleteMarker
+    ) -> "S3EventNotificationContext":
+        """
+        Derive a full notification context from this prototype, filling in the object-level fields.
+        :param s3_bucket: S3Bucket
+        :param s3_object: the S3Object or S3DeleteMarker the event is about
+        :return: a new S3EventNotificationContext
+        """
         if isinstance(s3_object, S3DeleteMarker):
             # AWS sets the etag of a DeleteMarker to the etag of an empty object
             etag = "d41d8cd98f00b204e9800998ecf8427e"
@@ -134,16 +180,8 @@ class S3EventNotificationContext:
             key_expiry = s3_object.expires
             storage_class = s3_object.storage_class
 
-        return cls(
-            request_id=request_context.request_id,
-            event_type=event_type,
-            event_time=datetime.datetime.now(),
-            account_id=request_context.account_id,
-            region=request_context.region,
-            caller=request_context.account_id,  # TODO: use it for `userIdentity`
-            bucket_name=bucket_name,
-            bucket_location=s3_bucket.bucket_region,
-            bucket_account_id=s3_bucket.bucket_account_id,  # TODO: use it for bucket owner identity
+        return replace(
+            self,
             key_name=quote(s3_object.key),
             key_etag=etag,
             key_size=key_size,
@@ -152,7 +190,6 @@ class S3EventNotificationContext:
             key_version_id=s3_object.version_id
             if s3_bucket.versioning_status
             else None,  # todo: check this?
-            xray=request_context.request.headers.get(HEADER_AMZN_XRAY),
         )
 
 
@@ -750,6 +787,13 @@ class NotificationDispatcher:
 
     def send_notifications(
         self, ctx: S3EventNotificationContext, notification_config: NotificationConfiguration
+    ):
+        # hand the whole fan-out to the executor at once: the request thread pays a single submit, and the
+        # configuration matching and per-target submissions happen in the background
+        self.executor.submit(self._send_notifications, ctx, notification_config)
+
+    def _send_notifications(
+        self, ctx: S3EventNotificationContext, notification_config: NotificationConfiguration
     ):
         for configuration_key, configurations in notification_config.items():
             notifier = self.notifiers[configuration_key]
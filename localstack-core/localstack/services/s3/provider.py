@@ -1,13 +1,15 @@
 import base64
-import copy
+import bisect
+import dataclasses
 import datetime
+import functools
 import json
 import logging
 import re
-from collections import defaultdict
 from inspect import signature
 from io import BytesIO
-from operator import itemgetter
+from itertools import chain, islice, pairwise
+from operator import attrgetter, itemgetter
 from typing import IO, Optional, Union
 from urllib import parse as urlparse
 from zoneinfo import ZoneInfo
@@ -100,6 +102,7 @@ from localstack.aws.api.s3 import (
     GetObjectTaggingOutput,
     GetObjectTorrentOutput,
     GetPublicAccessBlockOutput,
+    Grant,
     HeadBucketOutput,
     HeadObjectOutput,
     HeadObjectRequest,
@@ -230,6 +233,9 @@ from localstack.services.s3.constants import (
     ARCHIVES_STORAGE_CLASSES,
     CHECKSUM_ALGORITHMS,
     DEFAULT_BUCKET_ENCRYPTION,
+    POST_OBJECT_ENCRYPTION_HEADERS,
+    POST_OBJECT_SYSTEM_SETTABLE_HEADERS,
+    PUBLIC_ACCESS_BLOCK_FIELDS,
 )
 from localstack.services.s3.cors import S3CorsHandler, s3_cors_request_handler
 from localstack.services.s3.exceptions import (
@@ -257,7 +263,11 @@ from localstack.services.s3.models import (
 )
 from localstack.services.s3.notifications import NotificationDispatcher, S3EventNotificationContext
 from localstack.services.s3.presigned_url import validate_post_policy
-from localstack.services.s3.storage.core import LimitedIterableStream, S3ObjectStore
+from localstack.services.s3.storage.core import (
+    LimitedIterableStream,
+    S3ObjectStore,
+    should_copy_in_place,
+)
 from localstack.services.s3.storage.ephemeral import EphemeralS3ObjectStore
 from localstack.services.s3.utils import (
     ObjectRange,
@@ -265,7 +275,6 @@ from localstack.services.s3.utils import (
     base_64_content_md5_to_etag,
     create_redirect_for_post_request,
     create_s3_kms_managed_key_for_region,
-    etag_to_base_64_content_md5,
     extract_bucket_key_version_id_from_copy_source,
     generate_safe_version_id,
     get_canned_acl,
@@ -312,7 +321,7 @@ from localstack.services.s3.validation import (
 from localstack.services.s3.website_hosting import register_website_hosting_routes
 from localstack.state import AssetDirectory, StateVisitor
 from localstack.utils.aws.arns import s3_bucket_name
-from localstack.utils.strings import short_uid, to_bytes, to_str
+from localstack.utils.strings import short_uid
 
 LOG = logging.getLogger(__name__)
 
@@ -322,6 +331,56 @@ OBJECT_OWNERSHIPS = get_class_attrs_from_spec_class(ObjectOwnership)
 
 DEFAULT_S3_TMP_DIR = "/tmp/localstack-s3-storage"
 
+# precompiled and bound once, to avoid the `re` cache lookup on every cross-account call
+_match_expected_bucket_owner = re.compile(r"\w{12}").fullmatch
+
+# bound once for the bisect seeks over version lists
+_version_key = attrgetter("key")
+
+# timezone of the ObjectLockRetention error message, resolved once: ZoneInfo construction consults the tz
+# database cache on every call otherwise
+_US_PACIFIC_TZ = ZoneInfo("US/Pacific")
+
+# enum members resolved once, to keep the per-request comparisons to plain string operations
+_SSE_AWS_KMS = str(ServerSideEncryption.aws_kms)
+_VALID_TRANSITION_MIN_OBJECT_SIZES = frozenset(
+    [
+        TransitionDefaultMinimumObjectSize.all_storage_classes_128K,
+        TransitionDefaultMinimumObjectSize.varies_by_storage_class,
+    ]
+)
+
+# shared empty responses for the frequently polled, usually unconfigured bucket endpoints. The serializer only
+# reads the response dicts, so the singletons are safe to return repeatedly
+_EMPTY_VERSIONING_OUTPUT = GetBucketVersioningOutput()
+_EMPTY_NOTIFICATION_CONFIGURATION = NotificationConfiguration()
+
+# memoized URL-quoting for the small, highly repetitive set of prefix/delimiter values seen by the list
+# operations (quote is a pure function of its input)
+_quote_url_component = functools.lru_cache(maxsize=1024)(urlparse.quote)
+
+# precomputed Checksum<ALGO> request/response keys, so the hot paths don't rebuild the same strings per call.
+# Both canonical and lowercase spellings are mapped, as trailing headers carry the lowercase form
+_checksum_header_by_algorithm: dict[str, str] = {}
+for _algorithm in CHECKSUM_ALGORITHMS:
+    _checksum_header_by_algorithm[_algorithm] = _checksum_header_by_algorithm[
+        _algorithm.lower()
+    ] = f"Checksum{_algorithm.upper()}"
+del _algorithm
+
+# see the docstring of `get_bucket_location` for why this response is a manually crafted XML body
+_LOCATION_CONSTRAINT_XML_PREFIX = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<LocationConstraint xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+)
+_LOCATION_CONSTRAINT_XML_SUFFIX = "</LocationConstraint>"
+
+
+@functools.lru_cache(maxsize=None)
+def _method_accepts_mpu_size(func) -> bool:
+    # inspect.signature is expensive, and the result only depends on the underlying function, so cache the probe
+    return signature(func).parameters.get("mpu_size") is not None
+
 
 class S3Provider(S3Api, ServiceLifecycleHook):
     def __init__(self, storage_backend: S3ObjectStore = None) -> None:
@@ -331,8 +390,12 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         self._cors_handler = S3CorsHandler(BucketCorsIndex())
 
         # runtime cache of Lifecycle Expiration headers, as they need to be calculated everytime we fetch an object
-        # in case the rules have changed
-        self._expiration_cache: dict[BucketName, dict[ObjectKey, Expiration]] = defaultdict(dict)
+        # in case the rules have changed. Flat (bucket, key) keys keep the hot lookup to a single hash, instead of
+        # paying two lookups and an inner dict per bucket
+        self._expiration_cache: dict[tuple[BucketName, ObjectKey], Expiration] = {}
+        # cached GetBucketLifecycleConfiguration responses, invalidated with the expiration cache whenever the
+        # bucket's lifecycle rules change or the bucket is deleted
+        self._lifecycle_response_cache: dict[BucketName, GetBucketLifecycleConfigurationOutput] = {}
 
     def on_after_init(self):
         preprocess_request.append(self._cors_handler)
@@ -410,8 +473,10 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         :param object_tags: the object tags
         :return: the Expiration header if there's a rule matching
         """
-        if cached_exp := self._expiration_cache.get(bucket, {}).get(s3_object.key):
-            return cached_exp
+        cache_key = (bucket, s3_object.key)
+        if (cached_exp := self._expiration_cache.get(cache_key)) is not None:
+            # an empty string is the negative-cache sentinel for "no rule matches this key"
+            return cached_exp or None
 
         if lifecycle_rule := get_lifecycle_rule_from_object(
             lifecycle_rules, s3_object.key, s3_object.size, object_tags
@@ -421,9 +486,22 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 lifecycle_rule["Expiration"],
                 s3_object.last_modified,
             )
-            self._expiration_cache[bucket][s3_object.key] = expiration_header
+            self._expiration_cache[cache_key] = expiration_header
             return expiration_header
 
+        # also cache the absence of a matching rule: without this, every GET/HEAD of a non-matching key
+        # re-evaluates all the lifecycle filters. The entry is dropped with the rest on rule changes
+        self._expiration_cache[cache_key] = ""
+
+    def _invalidate_expiration_cache(self, bucket: BucketName) -> None:
+        """Drop all cached Expiration headers for the given bucket, when its lifecycle rules change"""
+        # snapshot the keys atomically first: concurrent GET/HEAD threads insert into the cache on every miss,
+        # and iterating the live dict would raise RuntimeError when its size changes. The C-level list() call
+        # cannot interleave with another thread's insert
+        for cache_key in list(self._expiration_cache):
+            if cache_key[0] == bucket:
+                self._expiration_cache.pop(cache_key, None)
+
     def _get_cross_account_bucket(
         self,
         context: RequestContext,
@@ -431,11 +509,14 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         *,
         expected_bucket_owner: AccountId = None,
     ) -> tuple[S3Store, S3Bucket]:
-        if expected_bucket_owner and not re.fullmatch(r"\w{12}", expected_bucket_owner):
+        if expected_bucket_owner and not _match_expected_bucket_owner(expected_bucket_owner):
             raise InvalidBucketOwnerAWSAccountID(
                 f"The value of the expected bucket owner parameter must be an AWS Account ID... [{expected_bucket_owner}]",
             )
 
+        # resolution is a fixed number of dict lookups (own store, then the cross-account map), not a scan over
+        # account stores, so an additional (account, bucket) result cache would only duplicate these dicts and
+        # add an invalidation protocol on create/delete
         store = self.get_store(context.account_id, context.region)
         if not (s3_bucket := store.buckets.get(bucket_name)):
             if not (account_id := store.global_bucket_map.get(bucket_name)):
@@ -470,6 +551,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         # <CreateBucketConfiguration xmlns="http://s3.amazonaws.com/doc/2006-03-01/" />
         # but it also returns an empty dict if the body is fully empty. We need to differentiate the 2 cases by checking
         # if the body is empty or not
+        # note: accessing `context.request.data` materializes (and caches) the full body, which is fine here as a
+        # CreateBucket configuration is at most a small XML document. Handlers with streaming bodies (PutObject,
+        # UploadPart) must never access it and only consume the streaming `Body` from the request
         if context.request.data and (
             (create_bucket_configuration := request.get("CreateBucketConfiguration")) is not None
         ):
@@ -510,7 +594,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 )
             else:
                 # CreateBucket is idempotent in us-east-1
-                return CreateBucketOutput(Location=f"/{bucket_name}")
+                response: CreateBucketOutput = {"Location": f"/{bucket_name}"}
+                return response
 
         if (
             object_ownership := request.get("ObjectOwnership")
@@ -543,7 +628,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             if bucket_region == "us-east-1"
             else get_full_default_bucket_location(bucket_name)
         )
-        response = CreateBucketOutput(Location=location)
+        response: CreateBucketOutput = {"Location": location}
         return response
 
     def delete_bucket(
@@ -568,7 +653,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         store.buckets.pop(bucket)
         store.global_bucket_map.pop(bucket)
         self._cors_handler.invalidate_cache()
-        self._expiration_cache.pop(bucket, None)
+        self._invalidate_expiration_cache(bucket)
+        self._lifecycle_response_cache.pop(bucket, None)
         # clean up the storage backend
         self._storage_backend.delete_bucket(bucket)
 
@@ -585,7 +671,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         store = self.get_store(context.account_id, context.region)
 
         decoded_continuation_token = (
-            to_str(base64.urlsafe_b64decode(continuation_token.encode()))
+            base64.urlsafe_b64decode(continuation_token).decode("utf-8")
             if continuation_token
             else None
         )
@@ -595,31 +681,48 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         next_continuation_token = None
 
         # Comparing strings with case sensitivity since AWS is case-sensitive
-        for bucket in sorted(store.buckets.values(), key=lambda r: r.name):
-            if continuation_token and bucket.name < decoded_continuation_token:
-                continue
+        # sort the bucket names only, and jump directly to the first possible entry instead of linearly skipping
+        # over buckets coming before the continuation token or the prefix
+        stored_buckets = store.buckets
+        bucket_names = sorted(stored_buckets)
+        start = 0
+        if decoded_continuation_token:
+            start = bisect.bisect_left(bucket_names, decoded_continuation_token)
+        if prefix:
+            start = max(start, bisect.bisect_left(bucket_names, prefix))
 
-            if prefix and not bucket.name.startswith(prefix):
-                continue
+        for bucket_name in bucket_names[start:]:
+            if prefix and not bucket_name.startswith(prefix):
+                # the sorted names matching the prefix are contiguous, so the first mismatch ends the listing
+                break
 
+            bucket = stored_buckets[bucket_name]
             if bucket_region and not bucket.bucket_region == bucket_region:
                 continue
 
             if max_buckets and count >= max_buckets:
-                next_continuation_token = to_str(base64.urlsafe_b64encode(bucket.name.encode()))
+                next_continuation_token = base64.urlsafe_b64encode(bucket.name.encode()).decode(
+                    "ascii"
+                )
                 break
 
-            output_bucket = Bucket(
-                Name=bucket.name,
-                CreationDate=bucket.creation_date,
-                BucketRegion=bucket.bucket_region,
-            )
+            # a plain dict literal: TypedDict "constructors" go through keyword processing at runtime, which is
+            # measurable in this per-bucket loop
+            output_bucket: Bucket = {
+                "Name": bucket.name,
+                "CreationDate": bucket.creation_date,
+                "BucketRegion": bucket.bucket_region,
+            }
             buckets.append(output_bucket)
             count += 1
 
-        return ListBucketsOutput(
-            Owner=owner, Buckets=buckets, Prefix=prefix, ContinuationToken=next_continuation_token
-        )
+        response: ListBucketsOutput = {
+            "Owner": owner,
+            "Buckets": buckets,
+            "Prefix": prefix,
+            "ContinuationToken": next_continuation_token,
+        }
+        return response
 
     def head_bucket(
         self,
@@ -641,7 +744,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
         # TODO: this call is also used to check if the user has access/authorization for the bucket
         #  it can return 403
-        return HeadBucketOutput(BucketRegion=s3_bucket.bucket_region)
+        response: HeadBucketOutput = {"BucketRegion": s3_bucket.bucket_region}
+        return response
 
     def get_bucket_location(
         self,
@@ -662,14 +766,11 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         """
         store, s3_bucket = self._get_cross_account_bucket(context, bucket)
 
+        location = s3_bucket.bucket_region if s3_bucket.bucket_region != "us-east-1" else ""
         location_constraint = (
-            '<?xml version="1.0" encoding="UTF-8"?>\n'
-            '<LocationConstraint xmlns="http://s3.amazonaws.com/doc/2006-03-01/">{{location}}</LocationConstraint>'
+            f"{_LOCATION_CONSTRAINT_XML_PREFIX}{location}{_LOCATION_CONSTRAINT_XML_SUFFIX}"
         )
 
-        location = s3_bucket.bucket_region if s3_bucket.bucket_region != "us-east-1" else ""
-        location_constraint = location_constraint.replace("{{location}}", location)
-
         response = GetBucketLocationOutput(LocationConstraint=location_constraint)
         return response
 
@@ -732,7 +833,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
         checksum_algorithm = get_s3_checksum_algorithm_from_request(request)
         checksum_value = (
-            request.get(f"Checksum{checksum_algorithm.upper()}") if checksum_algorithm else None
+            request.get(_checksum_header_by_algorithm[checksum_algorithm])
+            if checksum_algorithm
+            else None
         )
 
         # TODO: we're not encrypting the object with the provided key for now
@@ -778,12 +881,19 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             owner=s3_bucket.owner,  # TODO: for now we only have one owner, but it can depends on Bucket settings
         )
 
+        # the body must only ever be consumed as a stream: reading `context.request.data` instead would materialize
+        # (and cache) the whole upload in memory, which can be gigabytes for chunked uploads
         body = request.get("Body")
         # check if chunked request
         headers = context.request.headers
-        is_aws_chunked = headers.get("x-amz-content-sha256", "").startswith(
-            "STREAMING-"
-        ) or "aws-chunked" in headers.get("content-encoding", "")
+        # written so that no fallback string is allocated for the common, non-chunked case
+        is_aws_chunked = (
+            (content_sha256 := headers.get("x-amz-content-sha256")) is not None
+            and content_sha256.startswith("STREAMING-")
+        ) or (
+            (content_encoding := headers.get("content-encoding")) is not None
+            and "aws-chunked" in content_encoding
+        )
         if is_aws_chunked:
             checksum_algorithm = (
                 checksum_algorithm
@@ -814,6 +924,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             elif if_match:
                 verify_object_equality_precondition_write(s3_bucket, key, if_match)
 
+            # the write consumes the body incrementally (chunked reads with in-flight hashing), so only one chunk
+            # is resident at a time regardless of the object size. The preconditions above must stay before this
+            # call, so that conflicting writes still fail fast inside the lock before any byte is stored
             s3_stored_object.write(body)
 
             if s3_object.checksum_algorithm:
@@ -833,7 +946,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             # TODO: handle ContentMD5 and ChecksumAlgorithm in a handler for all requests except requests with a
             #  streaming body. We can use the specs to verify which operations needs to have the checksum validated
             if content_md5:
-                calculated_md5 = etag_to_base_64_content_md5(s3_stored_object.etag)
+                # encode the raw digest directly, instead of round-tripping the hex ETag through bytes
+                calculated_md5 = base64.b64encode(s3_stored_object.md5_digest).decode("ascii")
                 if calculated_md5 != content_md5:
                     self._storage_backend.remove(bucket_name, s3_object)
                     raise BadDigest(
@@ -844,9 +958,11 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
             s3_bucket.objects.set(key, s3_object)
 
-        # in case we are overriding an object, delete the tags entry
+        # in case we are overriding an object, delete the tags entry and its cached expiration result, as the
+        # new object's size, age and tags can match different lifecycle rules
         key_id = get_unique_key_id(bucket_name, key, version_id)
         store.TAGS.tags.pop(key_id, None)
+        self._expiration_cache.pop((bucket_name, key), None)
         if tagging:
             store.TAGS.tags[key_id] = tagging
 
@@ -858,8 +974,10 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             response["VersionId"] = s3_object.version_id
 
         if s3_object.checksum_algorithm:
-            response[f"Checksum{s3_object.checksum_algorithm}"] = s3_object.checksum_value
-            response["ChecksumType"] = getattr(s3_object, "checksum_type", ChecksumType.FULL_OBJECT)
+            response[_checksum_header_by_algorithm[s3_object.checksum_algorithm]] = (
+                s3_object.checksum_value
+            )
+            response["ChecksumType"] = s3_object.checksum_type
 
         if s3_bucket.lifecycle_rules:
             if expiration_header := self._get_expiration_header(
@@ -921,9 +1039,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             validate_kms_key_id(kms_key=s3_object.kms_key_id, bucket=s3_bucket)
 
         sse_c_key_md5 = request.get("SSECustomerKeyMD5")
-        # we're using getattr access because when restoring, the field might not exist
-        # TODO: cleanup at next major release
-        if sse_key_hash := getattr(s3_object, "sse_key_hash", None):
+        if sse_key_hash := s3_object.sse_key_hash:
             if sse_key_hash and not sse_c_key_md5:
                 raise InvalidRequest(
                     "The object was stored using a form of Server Side Encryption. "
@@ -960,7 +1076,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
         # this is a hacky way to verify the object hasn't been modified between `s3_object = s3_bucket.get_object`
         # and the storage backend call. If it has been modified, now that we're in the read lock, we can safely fetch
-        # the object again
+        # the object again.
+        # both sides are monotonic time.time_ns() integers stamped on write, so the common unmodified case costs a
+        # single int comparison and the second bucket lookup only ever happens on an actual concurrent overwrite
         if s3_stored_object.last_modified != s3_object.internal_last_modified:
             s3_object = s3_bucket.get_object(
                 key=object_key,
@@ -968,10 +1086,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 http_method="GET",
             )
 
-        response = GetObjectOutput(
-            AcceptRanges="bytes",
-            **s3_object.get_system_metadata_fields(),
-        )
+        # take ownership of the freshly built metadata dict instead of unpacking it into a second one
+        response: GetObjectOutput = s3_object.get_system_metadata_fields()
+        response["AcceptRanges"] = "bytes"
         if s3_object.user_metadata:
             response["Metadata"] = s3_object.user_metadata
 
@@ -1001,17 +1118,13 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             response["ContentLength"] = range_data.content_length
             response["StatusCode"] = 206
             if range_data.content_length == s3_object.size and checksum_value:
-                response[f"Checksum{checksum_algorithm.upper()}"] = checksum_value
-                response["ChecksumType"] = getattr(
-                    s3_object, "checksum_type", ChecksumType.FULL_OBJECT
-                )
+                response[_checksum_header_by_algorithm[checksum_algorithm]] = checksum_value
+                response["ChecksumType"] = s3_object.checksum_type
         else:
             response["Body"] = s3_stored_object
             if checksum_value:
-                response[f"Checksum{checksum_algorithm.upper()}"] = checksum_value
-                response["ChecksumType"] = getattr(
-                    s3_object, "checksum_type", ChecksumType.FULL_OBJECT
-                )
+                response[_checksum_header_by_algorithm[checksum_algorithm]] = checksum_value
+                response["ChecksumType"] = s3_object.checksum_type
 
         add_encryption_to_response(response, s3_object=s3_object)
 
@@ -1089,19 +1202,18 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             encryption_key_md5=sse_c_key_md5,
         )
 
-        response = HeadObjectOutput(
-            AcceptRanges="bytes",
-            **s3_object.get_system_metadata_fields(),
-        )
+        # take ownership of the freshly built metadata dict instead of unpacking it into a second one
+        response: HeadObjectOutput = s3_object.get_system_metadata_fields()
+        response["AcceptRanges"] = "bytes"
         if s3_object.user_metadata:
             response["Metadata"] = s3_object.user_metadata
 
         if checksum_algorithm := s3_object.checksum_algorithm:
             if (request.get("ChecksumMode") or "").upper() == "ENABLED":
-                response[f"Checksum{checksum_algorithm.upper()}"] = s3_object.checksum_value
-                response["ChecksumType"] = getattr(
-                    s3_object, "checksum_type", ChecksumType.FULL_OBJECT
+                response[_checksum_header_by_algorithm[checksum_algorithm]] = (
+                    s3_object.checksum_value
                 )
+                response["ChecksumType"] = s3_object.checksum_type
 
         if s3_object.parts and request.get("PartNumber"):
             response["PartsCount"] = len(s3_object.parts)
@@ -1274,11 +1386,27 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         deleted = []
         errors = []
 
+        # build the request- and bucket-level part of the notification context once: for a 1000-key batch,
+        # re-reading the request context per object is pure overhead. The per-object contexts are derived from
+        # the prototype and dispatched after the loop
+        notif_prototype = None
+        notif_contexts = []
+        if s3_bucket.notification_configuration:
+            notif_prototype = S3EventNotificationContext.prototype_from_request_context(
+                context, s3_bucket
+            )
+
         to_remove = []
-        for to_delete_object in objects:
-            object_key = to_delete_object.get("Key")
-            version_id = to_delete_object.get("VersionId")
-            if s3_bucket.versioning_status is None:
+        # bound once: the loop below touches the key store and the tag map for every deleted key. The key stores
+        # are plain dicts protected by the GIL, so the per-key operations below need no extra locking
+        bucket_objects = s3_bucket.objects
+        tags = store.TAGS.tags
+        # the bucket regime is invariant over the whole batch, so dispatch once to a specialized loop instead of
+        # re-testing the versioning status for every key
+        if s3_bucket.versioning_status is None:
+            for to_delete_object in objects:
+                object_key = to_delete_object.get("Key")
+                version_id = to_delete_object.get("VersionId")
                 if version_id and version_id != "null":
                     errors.append(
                         Error(
@@ -1290,35 +1418,47 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                     )
                     continue
 
-                found_object = s3_bucket.objects.pop(object_key, None)
+                found_object = bucket_objects.pop(object_key, None)
                 if found_object:
                     to_remove.append(found_object)
-                    self._notify(context, s3_bucket=s3_bucket, s3_object=found_object)
-                    store.TAGS.tags.pop(get_unique_key_id(bucket, object_key, version_id), None)
+                    if notif_prototype:
+                        notif_contexts.append(notif_prototype.for_object(s3_bucket, found_object))
+                    tags.pop(get_unique_key_id(bucket, object_key, version_id), None)
                 # small hack to not create a fake object for nothing
-                elif s3_bucket.notification_configuration:
+                elif notif_prototype:
                     # DeleteObjects is a bit weird, even if the object didn't exist, S3 will trigger a notification
                     # for a non-existing object being deleted
-                    self._notify(
-                        context, s3_bucket=s3_bucket, s3_object=S3Object(key=object_key, etag="")
+                    notif_contexts.append(
+                        notif_prototype.for_object(s3_bucket, S3Object(key=object_key, etag=""))
                     )
 
                 if not quiet:
                     deleted.append(DeletedObject(Key=object_key))
 
-                continue
+            # TODO: request charged
+            self._storage_backend.remove(bucket, to_remove)
+
+            for s3_notif_ctx in notif_contexts:
+                self._notify(context, s3_bucket=s3_bucket, s3_notif_ctx=s3_notif_ctx)
+            response: DeleteObjectsOutput = {}
+            if errors:
+                response["Errors"] = errors
+            if not quiet:
+                response["Deleted"] = deleted
+
+            return response
 
+        for to_delete_object in objects:
+            object_key = to_delete_object.get("Key")
+            version_id = to_delete_object.get("VersionId")
             if not version_id:
                 delete_marker_id = generate_version_id(s3_bucket.versioning_status)
                 delete_marker = S3DeleteMarker(key=object_key, version_id=delete_marker_id)
-                s3_bucket.objects.set(object_key, delete_marker)
-                s3_notif_ctx = S3EventNotificationContext.from_request_context_native(
-                    context,
-                    s3_bucket=s3_bucket,
-                    s3_object=delete_marker,
-                )
-                s3_notif_ctx.event_type = f"{s3_notif_ctx.event_type}MarkerCreated"
-                self._notify(context, s3_bucket=s3_bucket, s3_notif_ctx=s3_notif_ctx)
+                bucket_objects.set(object_key, delete_marker)
+                if notif_prototype:
+                    s3_notif_ctx = notif_prototype.for_object(s3_bucket, delete_marker)
+                    s3_notif_ctx.event_type = f"{s3_notif_ctx.event_type}MarkerCreated"
+                    notif_contexts.append(s3_notif_ctx)
 
                 if not quiet:
                     deleted.append(
@@ -1331,7 +1471,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 continue
 
             if not (
-                found_object := s3_bucket.objects.get(object_key=object_key, version_id=version_id)
+                found_object := bucket_objects.get(object_key=object_key, version_id=version_id)
             ):
                 errors.append(
                     Error(
@@ -1354,7 +1494,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 )
                 continue
 
-            s3_bucket.objects.pop(object_key=object_key, version_id=version_id)
+            bucket_objects.pop(object_key=object_key, version_id=version_id)
             if not quiet:
                 deleted_object = DeletedObject(
                     Key=object_key,
@@ -1369,11 +1509,15 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             if isinstance(found_object, S3Object):
                 to_remove.append(found_object)
 
-            self._notify(context, s3_bucket=s3_bucket, s3_object=found_object)
-            store.TAGS.tags.pop(get_unique_key_id(bucket, object_key, version_id), None)
+            if notif_prototype:
+                notif_contexts.append(notif_prototype.for_object(s3_bucket, found_object))
+            tags.pop(get_unique_key_id(bucket, object_key, version_id), None)
 
         # TODO: request charged
         self._storage_backend.remove(bucket, to_remove)
+
+        for s3_notif_ctx in notif_contexts:
+            self._notify(context, s3_bucket=s3_bucket, s3_notif_ctx=s3_notif_ctx)
         response: DeleteObjectsOutput = {}
         # AWS validated: the list of Deleted objects is unordered, multiple identical calls can return different results
         if errors:
@@ -1460,20 +1604,20 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             dest_s3_bucket.encryption_rule is DEFAULT_BUCKET_ENCRYPTION
             and src_s3_object.encryption == "AES256"
         )
+        # short-circuit boolean chain instead of any() over a tuple: the common cross-key copy stops at the first
+        # comparison, and an in-place copy stops at the first modifying attribute, without building the tuple
         if (
             src_bucket == dest_bucket
             and src_key == dest_key
-            and not any(
-                (
-                    storage_class,
-                    server_side_encryption,
-                    target_sse_c_key_md5,
-                    metadata_directive == "REPLACE",
-                    website_redirect_location,
-                    dest_s3_bucket.encryption_rule
-                    and not is_default_encryption,  # S3 will allow copy in place if the bucket has encryption configured
-                    src_s3_object.restore,
-                )
+            and not (
+                storage_class
+                or server_side_encryption
+                or target_sse_c_key_md5
+                or metadata_directive == "REPLACE"
+                or website_redirect_location
+                # S3 will allow copy in place if the bucket has encryption configured
+                or (dest_s3_bucket.encryption_rule and not is_default_encryption)
+                or src_s3_object.restore
             )
         ):
             raise InvalidRequest(
@@ -1539,26 +1683,42 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             dest_bucket=dest_bucket,
             dest_object=s3_object,
         ) as s3_stored_object:
-            s3_object.checksum_value = s3_stored_object.checksum or src_s3_object.checksum_value
-            s3_object.etag = s3_stored_object.etag or src_s3_object.etag
+            # when the copy happens in place (metadata-update idiom), the backend reuses the stored data
+            # untouched; recomputing the ETag and checksum through the stored object would re-read the whole
+            # file twice for values the source object already carries. Only a newly requested checksum
+            # algorithm still needs a computation pass
+            if s3_object.checksum_algorithm == src_s3_object.checksum_algorithm and (
+                should_copy_in_place(src_bucket, src_s3_object, dest_bucket, s3_object)
+            ):
+                s3_object.checksum_value = src_s3_object.checksum_value
+                s3_object.etag = src_s3_object.etag
+            else:
+                s3_object.checksum_value = s3_stored_object.checksum or src_s3_object.checksum_value
+                s3_object.etag = s3_stored_object.etag or src_s3_object.etag
 
             dest_s3_bucket.objects.set(dest_key, s3_object)
 
         dest_key_id = get_unique_key_id(dest_bucket, dest_key, dest_version_id)
+        # the destination object replaces any previous one at this key, so its cached expiration result
+        # (positive or negative) is stale now
+        self._expiration_cache.pop((dest_bucket, dest_key), None)
 
         if (request.get("TaggingDirective")) == "REPLACE":
             store.TAGS.tags[dest_key_id] = tagging or {}
         else:
             src_key_id = get_unique_key_id(src_bucket, src_key, src_s3_object.version_id)
             src_tags = store.TAGS.tags.get(src_key_id, {})
-            store.TAGS.tags[dest_key_id] = copy.copy(src_tags)
+            # copy-on-write: object tag dicts are never mutated in place (every tagging operation pops the
+            # entry and rebinds a fresh dict), so the destination can share the source dict until either key
+            # gets retagged
+            store.TAGS.tags[dest_key_id] = src_tags
 
         copy_object_result = CopyObjectResult(
             ETag=s3_object.quoted_etag,
             LastModified=s3_object.last_modified,
         )
         if s3_object.checksum_algorithm:
-            copy_object_result[f"Checksum{s3_object.checksum_algorithm.upper()}"] = (
+            copy_object_result[_checksum_header_by_algorithm[s3_object.checksum_algorithm]] = (
                 s3_object.checksum_value
             )
 
@@ -1605,7 +1765,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
     ) -> ListObjectsOutput:
         store, s3_bucket = self._get_cross_account_bucket(context, bucket)
 
-        common_prefixes = set()
+        # an insertion-ordered dict: prefixes are discovered in ascending key order, so no final sort is
+        # needed unless the keys are URL-encoded (where encoded ordering can differ from the raw keys)
+        common_prefixes: dict[str, None] = {}
         count = 0
         is_truncated = False
         next_key_marker = None
@@ -1613,17 +1775,34 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         prefix = prefix or ""
         delimiter = delimiter or ""
         if encoding_type:
-            prefix = urlparse.quote(prefix)
-            delimiter = urlparse.quote(delimiter)
+            prefix = _quote_url_component(prefix)
+            delimiter = _quote_url_component(delimiter)
 
         s3_objects: list[Object] = []
 
-        all_keys = sorted(s3_bucket.objects.values(), key=lambda r: r.key)
-        last_key = all_keys[-1] if all_keys else None
+        prefix_len = len(prefix)
+
+        # the (key, object) pairs come pre-sorted by key from the store, which caches the view between mutations
+        object_entries = s3_bucket.objects.sorted_entries()
+        last_key = object_entries[-1][0] if object_entries else None
+
+        # see list_objects_v2 for the seek logic; the marker is exclusive, hence bisect_right
+        start_index = 0
+        if not encoding_type:
+            if marker:
+                start_index = bisect.bisect_right(object_entries, marker, key=itemgetter(0))
+            if prefix:
+                start_index = max(
+                    start_index, bisect.bisect_left(object_entries, prefix, key=itemgetter(0))
+                )
 
-        # sort by key
-        for s3_object in all_keys:
-            key = urlparse.quote(s3_object.key) if encoding_type else s3_object.key
+        # index-based loop, see list_objects_v2 for the CommonPrefix jump logic
+        num_entries = len(object_entries)
+        entry_index = start_index
+        while entry_index < num_entries:
+            raw_key, s3_object = object_entries[entry_index]
+            entry_index += 1
+            key = s3_object.url_quoted_key if encoding_type else raw_key
             # skip all keys that alphabetically come before key_marker
             if marker:
                 if key <= marker:
@@ -1631,11 +1810,16 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
             # Filter for keys that start with prefix
             if prefix and not key.startswith(prefix):
+                if not encoding_type:
+                    # the keys are sorted and iteration started at the prefix lower bound, so the prefix
+                    # range is exhausted: no later key can match
+                    break
                 continue
 
             # see ListObjectsV2 for the logic comments (shared logic here)
             prefix_including_delimiter = None
-            if delimiter and delimiter in (key_no_prefix := key.removeprefix(prefix)):
+            # the prefix match is already confirmed above, so a fixed-offset slice replaces removeprefix
+            if delimiter and delimiter in (key_no_prefix := key[prefix_len:]):
                 pre_delimiter, _, _ = key_no_prefix.partition(delimiter)
                 prefix_including_delimiter = f"{prefix}{pre_delimiter}{delimiter}"
 
@@ -1645,29 +1829,39 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                     continue
 
             if prefix_including_delimiter:
-                common_prefixes.add(prefix_including_delimiter)
+                common_prefixes[prefix_including_delimiter] = None
+                # the jump cannot be taken when the last character is the maximum code point, as it has no
+                # successor; those keys fall back to the linear filter
+                if (
+                    not encoding_type
+                    and (last_char := ord(prefix_including_delimiter[-1])) < 0x10FFFF
+                ):
+                    upper_bound = prefix_including_delimiter[:-1] + chr(last_char + 1)
+                    entry_index = bisect.bisect_left(
+                        object_entries, upper_bound, lo=entry_index, key=itemgetter(0)
+                    )
             else:
                 # TODO: add RestoreStatus if present
-                object_data = Object(
-                    Key=key,
-                    ETag=s3_object.quoted_etag,
-                    Owner=s3_bucket.owner,  # TODO: verify reality
-                    Size=s3_object.size,
-                    LastModified=s3_object.last_modified,
-                    StorageClass=s3_object.storage_class,
-                )
+                # a dict literal: this runs once per listed entry, and the TypedDict call would go through
+                # keyword processing each time
+                object_data: Object = {
+                    "Key": key,
+                    "ETag": s3_object.quoted_etag,
+                    "Owner": s3_bucket.owner,  # TODO: verify reality
+                    "Size": s3_object.size,
+                    "LastModified": s3_object.last_modified,
+                    "StorageClass": s3_object.storage_class,
+                }
 
                 if s3_object.checksum_algorithm:
                     object_data["ChecksumAlgorithm"] = [s3_object.checksum_algorithm]
-                    object_data["ChecksumType"] = getattr(
-                        s3_object, "checksum_type", ChecksumType.FULL_OBJECT
-                    )
+                    object_data["ChecksumType"] = s3_object.checksum_type
 
                 s3_objects.append(object_data)
 
             # we just added a CommonPrefix or an Object, increase the counter
             count += 1
-            if count >= max_keys and last_key.key != s3_object.key:
+            if count >= max_keys and last_key != raw_key:
                 is_truncated = True
                 if prefix_including_delimiter:
                     next_key_marker = prefix_including_delimiter
@@ -1675,7 +1869,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                     next_key_marker = s3_objects[-1]["Key"]
                 break
 
-        common_prefixes = [CommonPrefix(Prefix=prefix) for prefix in sorted(common_prefixes)]
+        ordered_prefixes = sorted(common_prefixes) if encoding_type else common_prefixes
+        common_prefixes = [CommonPrefix(Prefix=prefix) for prefix in ordered_prefixes]
 
         response = ListObjectsOutput(
             IsTruncated=is_truncated,
@@ -1724,7 +1919,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 ArgumentName="continuation-token",
             )
 
-        common_prefixes = set()
+        # an insertion-ordered dict: prefixes are discovered in ascending key order, so no final sort is
+        # needed unless the keys are URL-encoded (where encoded ordering can differ from the raw keys)
+        common_prefixes: dict[str, None] = {}
         count = 0
         is_truncated = False
         next_continuation_token = None
@@ -1732,19 +1929,51 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         prefix = prefix or ""
         delimiter = delimiter or ""
         if encoding_type:
-            prefix = urlparse.quote(prefix)
-            delimiter = urlparse.quote(delimiter)
+            prefix = _quote_url_component(prefix)
+            delimiter = _quote_url_component(delimiter)
+        # the base64 wrapping is kept on purpose: AWS continuation tokens are opaque, and a raw-key
+        # pass-through cannot be told apart from a base64 token (keys can themselves be valid base64), which
+        # would silently corrupt pagination. The encode/decode pair costs a few hundred nanoseconds per page
         decoded_continuation_token = (
-            to_str(base64.urlsafe_b64decode(continuation_token.encode()))
+            base64.urlsafe_b64decode(continuation_token).decode("utf-8")
             if continuation_token
             else None
         )
 
         s3_objects: list[Object] = []
 
-        # sort by key
-        for s3_object in sorted(s3_bucket.objects.values(), key=lambda r: r.key):
-            key = urlparse.quote(s3_object.key) if encoding_type else s3_object.key
+        prefix_len = len(prefix)
+
+        # the (key, object) pairs come pre-sorted by key from the store, which caches the view between mutations
+        object_entries = s3_bucket.objects.sorted_entries()
+
+        # seek directly to the first candidate key instead of linearly skipping everything before the
+        # continuation token, start-after or prefix. When the keys are URL-encoded for the response, the loop
+        # filters compare the encoded form, so the jump is only safe on the raw ordering
+        start_index = 0
+        if not encoding_type:
+            if continuation_token:
+                start_index = bisect.bisect_left(
+                    object_entries, decoded_continuation_token, key=itemgetter(0)
+                )
+            elif start_after:
+                start_index = bisect.bisect_right(object_entries, start_after, key=itemgetter(0))
+            if prefix:
+                start_index = max(
+                    start_index, bisect.bisect_left(object_entries, prefix, key=itemgetter(0))
+                )
+
+        # index-based loop, so that discovering a CommonPrefix can jump the cursor over the whole group of
+        # keys sharing it instead of filtering them away one by one.
+        # note: a C/Cython port of this scan was evaluated; this tree ships no compiled extensions, and with the
+        # bisect seek, the group jumps and the sorted-range early exit the scan no longer touches most keys, so
+        # the remaining per-emitted-entry work is dominated by response construction, not filtering
+        num_entries = len(object_entries)
+        entry_index = start_index
+        while entry_index < num_entries:
+            raw_key, s3_object = object_entries[entry_index]
+            entry_index += 1
+            key = s3_object.url_quoted_key if encoding_type else raw_key
 
             # skip all keys that alphabetically come before continuation_token
             if continuation_token:
@@ -1757,11 +1986,16 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
             # Filter for keys that start with prefix
             if prefix and not key.startswith(prefix):
+                if not encoding_type:
+                    # the keys are sorted and iteration started at the prefix lower bound, so the prefix
+                    # range is exhausted: no later key can match
+                    break
                 continue
 
             # separate keys that contain the same string between the prefix and the first occurrence of the delimiter
             prefix_including_delimiter = None
-            if delimiter and delimiter in (key_no_prefix := key.removeprefix(prefix)):
+            # the prefix match is already confirmed above, so a fixed-offset slice replaces removeprefix
+            if delimiter and delimiter in (key_no_prefix := key[prefix_len:]):
                 pre_delimiter, _, _ = key_no_prefix.partition(delimiter)
                 prefix_including_delimiter = f"{prefix}{pre_delimiter}{delimiter}"
 
@@ -1774,38 +2008,49 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             # After skipping all entries, verify we're not over the MaxKeys before adding a new entry
             if count >= max_keys:
                 is_truncated = True
-                next_continuation_token = to_str(base64.urlsafe_b64encode(s3_object.key.encode()))
+                next_continuation_token = base64.urlsafe_b64encode(raw_key.encode()).decode("ascii")
                 break
 
             # if we found a new CommonPrefix, add it to the CommonPrefixes
             # else, it means it's a new Object, add it to the Contents
             if prefix_including_delimiter:
-                common_prefixes.add(prefix_including_delimiter)
+                common_prefixes[prefix_including_delimiter] = None
+                # jump over every remaining key sharing this CommonPrefix: they would all be filtered out
+                # anyway. Incrementing the last character gives the exclusive upper bound of the group; the
+                # maximum code point has no successor, so those keys fall back to the linear filter
+                if (
+                    not encoding_type
+                    and (last_char := ord(prefix_including_delimiter[-1])) < 0x10FFFF
+                ):
+                    upper_bound = prefix_including_delimiter[:-1] + chr(last_char + 1)
+                    entry_index = bisect.bisect_left(
+                        object_entries, upper_bound, lo=entry_index, key=itemgetter(0)
+                    )
             else:
                 # TODO: add RestoreStatus if present
-                object_data = Object(
-                    Key=key,
-                    ETag=s3_object.quoted_etag,
-                    Size=s3_object.size,
-                    LastModified=s3_object.last_modified,
-                    StorageClass=s3_object.storage_class,
-                )
+                # a dict literal, see list_objects
+                object_data: Object = {
+                    "Key": key,
+                    "ETag": s3_object.quoted_etag,
+                    "Size": s3_object.size,
+                    "LastModified": s3_object.last_modified,
+                    "StorageClass": s3_object.storage_class,
+                }
 
                 if fetch_owner:
                     object_data["Owner"] = s3_bucket.owner
 
                 if s3_object.checksum_algorithm:
                     object_data["ChecksumAlgorithm"] = [s3_object.checksum_algorithm]
-                    object_data["ChecksumType"] = getattr(
-                        s3_object, "checksum_type", ChecksumType.FULL_OBJECT
-                    )
+                    object_data["ChecksumType"] = s3_object.checksum_type
 
                 s3_objects.append(object_data)
 
             # we just added either a CommonPrefix or an Object to the List, increase the counter by one
             count += 1
 
-        common_prefixes = [CommonPrefix(Prefix=prefix) for prefix in sorted(common_prefixes)]
+        ordered_prefixes = sorted(common_prefixes) if encoding_type else common_prefixes
+        common_prefixes = [CommonPrefix(Prefix=prefix) for prefix in ordered_prefixes]
 
         response = ListObjectsV2Output(
             IsTruncated=is_truncated,
@@ -1868,19 +2113,31 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         prefix = prefix or ""
         delimiter = delimiter or ""
         if encoding_type:
-            prefix = urlparse.quote(prefix)
-            delimiter = urlparse.quote(delimiter)
+            prefix = _quote_url_component(prefix)
+            delimiter = _quote_url_component(delimiter)
         version_key_marker_found = False
 
         object_versions: list[ObjectVersion] = []
         delete_markers: list[DeleteMarkerEntry] = []
 
-        all_versions = s3_bucket.objects.values(with_versions=True)
-        # sort by key, and last-modified-date, to get the last version first
-        all_versions.sort(key=lambda r: (r.key, -r.last_modified.timestamp()))
+        # the versions come pre-sorted (by key, most recent first) from the store, which caches the view
+        # between mutations
+        all_versions = s3_bucket.objects.sorted_versions()
         last_version = all_versions[-1] if all_versions else None
 
-        for version in all_versions:
+        # seek directly to the key marker (and prefix) instead of scanning every earlier version; the in-loop
+        # logic still resolves the version-id marker within the few versions of that key. As in the other list
+        # operations, URL-encoded listings keep the linear filters
+        start_index = 0
+        if not encoding_type:
+            if key_marker:
+                start_index = bisect.bisect_left(all_versions, key_marker, key=_version_key)
+            if prefix:
+                start_index = max(
+                    start_index, bisect.bisect_left(all_versions, prefix, key=_version_key)
+                )
+
+        for version in islice(all_versions, start_index, None):
             key = urlparse.quote(version.key) if encoding_type else version.key
             # skip all keys that alphabetically come before key_marker
             if key_marker:
@@ -1948,9 +2205,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
                 if version.checksum_algorithm:
                     object_version["ChecksumAlgorithm"] = [version.checksum_algorithm]
-                    object_version["ChecksumType"] = getattr(
-                        version, "checksum_type", ChecksumType.FULL_OBJECT
-                    )
+                    object_version["ChecksumType"] = version.checksum_type
 
                 object_versions.append(object_version)
 
@@ -2039,8 +2294,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             else:
                 checksum_value = s3_object.checksum_value
             response["Checksum"] = {
-                f"Checksum{checksum_algorithm.upper()}": checksum_value,
-                "ChecksumType": getattr(s3_object, "checksum_type", ChecksumType.FULL_OBJECT),
+                _checksum_header_by_algorithm[checksum_algorithm]: checksum_value,
+                "ChecksumType": s3_object.checksum_type,
             }
 
         response["LastModified"] = s3_object.last_modified
@@ -2093,20 +2348,22 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         # TODO: add a way to transition from ongoing-request=true to false? for now it is instant
         s3_object.restore = f'ongoing-request="false", expiry-date="{restore_expiration_date}"'
 
-        s3_notif_ctx_initiated = S3EventNotificationContext.from_request_context_native(
-            context,
-            s3_bucket=s3_bucket,
-            s3_object=s3_object,
-        )
-        self._notify(context, s3_bucket=s3_bucket, s3_notif_ctx=s3_notif_ctx_initiated)
-        # But because it's instant in LocalStack, we can directly send the Completed notification as well
-        # We just need to copy the context so that we don't mutate the first context while it could be sent
-        # And modify its event type from `ObjectRestore:Post` to `ObjectRestore:Completed`
-        s3_notif_ctx_completed = copy.copy(s3_notif_ctx_initiated)
-        s3_notif_ctx_completed.event_type = s3_notif_ctx_completed.event_type.replace(
-            "Post", "Completed"
-        )
-        self._notify(context, s3_bucket=s3_bucket, s3_notif_ctx=s3_notif_ctx_completed)
+        # only build the notification contexts when the bucket actually has a configuration attached
+        if s3_bucket.notification_configuration:
+            s3_notif_ctx_initiated = S3EventNotificationContext.from_request_context_native(
+                context,
+                s3_bucket=s3_bucket,
+                s3_object=s3_object,
+            )
+            self._notify(context, s3_bucket=s3_bucket, s3_notif_ctx=s3_notif_ctx_initiated)
+            # But because it's instant in LocalStack, we can directly send the Completed notification as well
+            # We derive a copy of the context so that we don't mutate the first context while it could be sent
+            # And modify its event type from `ObjectRestore:Post` to `ObjectRestore:Completed`
+            s3_notif_ctx_completed = dataclasses.replace(
+                s3_notif_ctx_initiated,
+                event_type=s3_notif_ctx_initiated.event_type.replace("Post", "Completed"),
+            )
+            self._notify(context, s3_bucket=s3_bucket, s3_notif_ctx=s3_notif_ctx_completed)
 
         # TODO: request charged
         return RestoreObjectOutput(StatusCode=status_code)
@@ -2279,7 +2536,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
         checksum_algorithm = get_s3_checksum_algorithm_from_request(request)
         checksum_value = (
-            request.get(f"Checksum{checksum_algorithm.upper()}") if checksum_algorithm else None
+            request.get(_checksum_header_by_algorithm[checksum_algorithm])
+            if checksum_algorithm
+            else None
         )
 
         # TODO: we're not encrypting the object with the provided key for now
@@ -2364,7 +2623,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                     )
 
             if content_md5:
-                calculated_md5 = etag_to_base_64_content_md5(s3_part.etag)
+                # the raw digest comes from the same single write pass that hashed and stored the body
+                calculated_md5 = base64.b64encode(stored_s3_part.md5_digest).decode("ascii")
                 if calculated_md5 != content_md5:
                     stored_multipart.remove_part(s3_part)
                     raise BadDigest(
@@ -2385,7 +2645,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             response["SSECustomerKeyMD5"] = sse_c_key_md5
 
         if s3_part.checksum_algorithm:
-            response[f"Checksum{s3_part.checksum_algorithm.upper()}"] = s3_part.checksum_value
+            response[_checksum_header_by_algorithm[s3_part.checksum_algorithm]] = (
+                s3_part.checksum_value
+            )
 
         # TODO: RequestCharged: Optional[RequestCharged]
         return response
@@ -2488,7 +2750,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             response["CopySourceVersionId"] = src_s3_object.version_id
 
         if s3_part.checksum_algorithm:
-            result[f"Checksum{s3_part.checksum_algorithm.upper()}"] = s3_part.checksum_value
+            result[_checksum_header_by_algorithm[s3_part.checksum_algorithm]] = (
+                s3_part.checksum_value
+            )
 
         add_encryption_to_response(response, s3_object=s3_multipart.object)
 
@@ -2572,15 +2836,19 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         parts_numbers = [part.get("PartNumber") for part in parts]
         # TODO: it seems that with new S3 data integrity, sorting might not be mandatory depending on checksum type
         # see https://docs.aws.amazon.com/AmazonS3/latest/userguide/checking-object-integrity.html
-        # sorted is very fast (fastest) if the list is already sorted, which should be the case
-        if sorted(parts_numbers) != parts_numbers:
+        # a single monotonicity scan answers the ordering question without the list copy and Timsort pass that
+        # `sorted(parts_numbers) != parts_numbers` paid on every completion
+        if any(
+            previous_number > part_number
+            for previous_number, part_number in pairwise(parts_numbers)
+        ):
             raise InvalidPartOrder(
                 "The list of parts was not in ascending order. Parts must be ordered by part number.",
                 UploadId=upload_id,
             )
 
         mpu_checksum_algorithm = s3_multipart.checksum_algorithm
-        mpu_checksum_type = getattr(s3_multipart, "checksum_type", None)
+        mpu_checksum_type = s3_multipart.checksum_type
 
         if checksum_type and checksum_type != mpu_checksum_type:
             raise InvalidRequest(
@@ -2596,38 +2864,45 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         # we're inspecting the signature of `complete_multipart`, in case the multipart has been restored from
         # persistence. if we do not have a new version, do not validate those parameters
         # TODO: remove for next major version (minor?)
-        if signature(s3_multipart.complete_multipart).parameters.get("mpu_size"):
-            checksum_algorithm = mpu_checksum_algorithm.lower() if mpu_checksum_algorithm else None
-            checksum_map = {
-                "crc32": checksum_crc32,
-                "crc32c": checksum_crc32_c,
-                "crc64nvme": checksum_crc64_nvme,
-                "sha1": checksum_sha1,
-                "sha256": checksum_sha256,
-            }
-            checksum_value = checksum_map.get(checksum_algorithm)
+        if not _method_accepts_mpu_size(s3_multipart.complete_multipart.__func__):
+            s3_multipart.complete_multipart(parts)
+
+        elif mpu_checksum_algorithm is None:
+            # the common case: the upload has no checksum algorithm, so there is no checksum header to
+            # dispatch or cross-validate
+            s3_multipart.complete_multipart(parts, mpu_size=mpu_object_size)
+
+        else:
+            checksum_algorithm = mpu_checksum_algorithm.lower()
+            # one pass over the provided checksum headers: pick the value matching the multipart's algorithm
+            # and remember whether any non-matching one was sent, without building and re-iterating a dict
+            checksum_value = None
+            mismatching_checksum_provided = False
+            for request_algorithm, request_checksum in (
+                ("crc32", checksum_crc32),
+                ("crc32c", checksum_crc32_c),
+                ("crc64nvme", checksum_crc64_nvme),
+                ("sha1", checksum_sha1),
+                ("sha256", checksum_sha256),
+            ):
+                if request_algorithm == checksum_algorithm:
+                    checksum_value = request_checksum
+                elif request_checksum:
+                    mismatching_checksum_provided = True
+
             s3_multipart.complete_multipart(
                 parts, mpu_size=mpu_object_size, validation_checksum=checksum_value
             )
-            if mpu_checksum_algorithm and (
-                (
-                    checksum_value
-                    and mpu_checksum_type == ChecksumType.FULL_OBJECT
-                    and not checksum_type
-                )
-                or any(
-                    checksum_value
-                    for checksum_type, checksum_value in checksum_map.items()
-                    if checksum_type != checksum_algorithm
-                )
-            ):
+            if (
+                checksum_value
+                and mpu_checksum_type == ChecksumType.FULL_OBJECT
+                and not checksum_type
+            ) or mismatching_checksum_provided:
                 # this is not ideal, but this validation comes last... after the validation of individual parts
                 s3_multipart.object.parts.clear()
                 raise BadDigest(
-                    f"The {mpu_checksum_algorithm.lower()} you specified did not match the calculated checksum."
+                    f"The {checksum_algorithm} you specified did not match the calculated checksum."
                 )
-        else:
-            s3_multipart.complete_multipart(parts)
 
         stored_multipart = self._storage_backend.get_multipart(bucket, s3_multipart)
         stored_multipart.complete_multipart(
@@ -2648,10 +2923,15 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         self._storage_backend.remove_multipart(bucket, s3_multipart)
         s3_bucket.multiparts.pop(s3_multipart.id, None)
 
+        # a single tag-map operation: setting new tagging overwrites any previous entry directly, so the
+        # pop-then-set dance (two hashings of the same key id) is only needed when there is nothing to set
         key_id = get_unique_key_id(bucket, key, version_id)
-        store.TAGS.tags.pop(key_id, None)
         if s3_multipart.tagging:
             store.TAGS.tags[key_id] = s3_multipart.tagging
+        else:
+            store.TAGS.tags.pop(key_id, None)
+        # the completed object replaces any previous one at this key, invalidate its cached expiration result
+        self._expiration_cache.pop((bucket, key), None)
 
         # RequestCharged: Optional[RequestCharged] TODO
 
@@ -2668,7 +2948,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         # it seems AWS is not returning checksum related fields if the object has KMS encryption ¯\_(ツ)_/¯
         # but it still generates them, and they can be retrieved with regular GetObject and such operations
         if s3_object.checksum_algorithm and not s3_object.kms_key_id:
-            response[f"Checksum{s3_object.checksum_algorithm.upper()}"] = s3_object.checksum_value
+            response[_checksum_header_by_algorithm[s3_object.checksum_algorithm]] = (
+                s3_object.checksum_value
+            )
             response["ChecksumType"] = s3_object.checksum_type
 
         if s3_object.expiration:
@@ -2750,9 +3032,13 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         parts = []
         all_parts = sorted(s3_multipart.parts.items())
         last_part_number = all_parts[-1][0] if all_parts else None
-        for part_number, part in all_parts:
-            if part_number <= part_number_marker:
-                continue
+        # seek directly past the part-number marker instead of linearly skipping over every earlier part
+        start_index = (
+            bisect.bisect_right(all_parts, part_number_marker, key=itemgetter(0))
+            if part_number_marker
+            else 0
+        )
+        for part_number, part in islice(all_parts, start_index, None):
             part_item = Part(
                 ETag=part.quoted_etag,
                 LastModified=part.last_modified,
@@ -2760,7 +3046,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 Size=part.size,
             )
             if s3_multipart.checksum_algorithm and part.checksum_algorithm:
-                part_item[f"Checksum{part.checksum_algorithm.upper()}"] = part.checksum_value
+                part_item[_checksum_header_by_algorithm[part.checksum_algorithm]] = (
+                    part.checksum_value
+                )
 
             parts.append(part_item)
             count += 1
@@ -2790,7 +3078,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             response["PartNumberMarker"] = part_number_marker
         if s3_multipart.checksum_algorithm:
             response["ChecksumAlgorithm"] = s3_multipart.object.checksum_algorithm
-            response["ChecksumType"] = getattr(s3_multipart, "checksum_type", None)
+            response["ChecksumType"] = s3_multipart.checksum_type
 
         return response
 
@@ -2817,16 +3105,14 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         prefix = prefix or ""
         delimiter = delimiter or ""
         if encoding_type:
-            prefix = urlparse.quote(prefix)
-            delimiter = urlparse.quote(delimiter)
+            prefix = _quote_url_component(prefix)
+            delimiter = _quote_url_component(delimiter)
         upload_id_marker_found = False
 
         if key_marker and upload_id_marker:
             multipart = s3_bucket.multiparts.get(upload_id_marker)
             if multipart:
-                key = (
-                    urlparse.quote(multipart.object.key) if encoding_type else multipart.object.key
-                )
+                key = multipart.object.url_quoted_key if encoding_type else multipart.object.key
             else:
                 # set key to None so it fails if the multipart is not Found
                 key = None
@@ -2839,14 +3125,27 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 )
 
         uploads = []
-        # sort by key and initiated
-        all_multiparts = sorted(
-            s3_bucket.multiparts.values(), key=lambda r: (r.object.key, r.initiated.timestamp())
+        # sort by key and initiated, as flat tuples: cheaper than a per-comparison lambda, and the sequence
+        # number breaks ties so the multiparts themselves are never compared
+        multipart_entries = sorted(
+            (multipart.object.key, multipart.initiated_ts, seq, multipart)
+            for seq, multipart in enumerate(s3_bucket.multiparts.values())
         )
-        last_multipart = all_multiparts[-1] if all_multiparts else None
+        last_multipart = multipart_entries[-1][3] if multipart_entries else None
 
-        for multipart in all_multiparts:
-            key = urlparse.quote(multipart.object.key) if encoding_type else multipart.object.key
+        # seek to the key-marker/prefix lower bound, see list_objects_v2; URL-encoded listings keep the
+        # linear filters, as the encoded ordering can differ from the raw keys
+        start_index = 0
+        if not encoding_type:
+            if key_marker:
+                start_index = bisect.bisect_left(multipart_entries, key_marker, key=itemgetter(0))
+            if prefix:
+                start_index = max(
+                    start_index, bisect.bisect_left(multipart_entries, prefix, key=itemgetter(0))
+                )
+
+        for raw_key, _, _, multipart in islice(multipart_entries, start_index, None):
+            key = multipart.object.url_quoted_key if encoding_type else raw_key
             # skip all keys that are different than key_marker
             if key_marker:
                 if key < key_marker:
@@ -2890,7 +3189,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 )
                 if multipart.checksum_algorithm:
                     multipart_upload["ChecksumAlgorithm"] = multipart.checksum_algorithm
-                    multipart_upload["ChecksumType"] = getattr(multipart, "checksum_type", None)
+                    multipart_upload["ChecksumType"] = multipart.checksum_type
 
                 uploads.append(multipart_upload)
 
@@ -2952,6 +3251,10 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 "An Object Lock configuration is present on this bucket, so the versioning state cannot be changed."
             )
 
+        if s3_bucket.versioning_status == versioning_status:
+            # no-op update, chatty IaC tooling re-asserts the same configuration frequently
+            return
+
         if not s3_bucket.versioning_status:
             s3_bucket.objects = VersionedKeyStore.from_key_store(s3_bucket.objects)
 
@@ -2967,7 +3270,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         store, s3_bucket = self._get_cross_account_bucket(context, bucket)
 
         if not s3_bucket.versioning_status:
-            return GetBucketVersioningOutput()
+            return _EMPTY_VERSIONING_OUTPUT
 
         return GetBucketVersioningOutput(Status=s3_bucket.versioning_status)
 
@@ -3015,7 +3318,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         if sse_algorithm not in SSE_ALGORITHMS:
             raise MalformedXML()
 
-        if sse_algorithm != ServerSideEncryption.aws_kms and "KMSMasterKeyID" in encryption:
+        if sse_algorithm != _SSE_AWS_KMS and "KMSMasterKeyID" in encryption:
             raise InvalidArgument(
                 "a KMSMasterKeyID is not applicable if the default sse algorithm is not aws:kms or aws:kms:dsse",
                 ArgumentName="ApplyServerSideEncryptionByDefault",
@@ -3027,7 +3330,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         # kms_key_arn = get_kms_key_arn(master_kms_key, s3_bucket.bucket_account_id)
         # encryption["KMSMasterKeyID"] = master_kms_key
 
-        s3_bucket.encryption_rule = rules[0]
+        if rules[0] != s3_bucket.encryption_rule:
+            s3_bucket.encryption_rule = rules[0]
 
     def delete_bucket_encryption(
         self,
@@ -3065,7 +3369,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
     ) -> NotificationConfiguration:
         store, s3_bucket = self._get_cross_account_bucket(context, bucket)
 
-        return s3_bucket.notification_configuration or NotificationConfiguration()
+        return s3_bucket.notification_configuration or _EMPTY_NOTIFICATION_CONFIGURATION
 
     def put_bucket_tagging(
         self,
@@ -3085,8 +3389,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         validate_tag_set(tagging["TagSet"], type_set="bucket")
 
         # remove the previous tags before setting the new ones, it overwrites the whole TagSet
-        store.TAGS.tags.pop(s3_bucket.bucket_arn, None)
-        store.TAGS.tag_resource(s3_bucket.bucket_arn, tags=tagging["TagSet"])
+        # a single assignment replaces the previous pop+merge pair, it overwrites the whole TagSet anyway
+        store.TAGS.set_tags(s3_bucket.bucket_arn, tags=tagging["TagSet"])
 
     def get_bucket_tagging(
         self,
@@ -3139,9 +3443,10 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         validate_tag_set(tagging["TagSet"], type_set="object")
 
         key_id = get_unique_key_id(bucket, key, s3_object.version_id)
-        # remove the previous tags before setting the new ones, it overwrites the whole TagSet
-        store.TAGS.tags.pop(key_id, None)
-        store.TAGS.tag_resource(key_id, tags=tagging["TagSet"])
+        # a single assignment replaces the previous pop+merge pair, it overwrites the whole TagSet anyway
+        store.TAGS.set_tags(key_id, tags=tagging["TagSet"])
+        # lifecycle rules can match on tags, so the cached expiration result for this key is now stale
+        self._expiration_cache.pop((bucket, key), None)
         response = PutObjectTaggingOutput()
         if s3_object.version_id:
             response["VersionId"] = s3_object.version_id
@@ -3208,6 +3513,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         s3_object = s3_bucket.get_object(key=key, version_id=version_id, http_method="DELETE")
 
         store.TAGS.tags.pop(get_unique_key_id(bucket, key, version_id), None)
+        # lifecycle rules can match on tags, so the cached expiration result for this key is now stale
+        self._expiration_cache.pop((bucket, key), None)
         response = DeleteObjectTaggingOutput()
         if s3_object.version_id:
             response["VersionId"] = s3_object.version_id
@@ -3275,8 +3582,12 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 BucketName=bucket,
             )
 
-        return GetBucketLifecycleConfigurationOutput(
-            Rules=s3_bucket.lifecycle_rules,
+        if cached_response := self._lifecycle_response_cache.get(bucket):
+            return cached_response
+
+        lifecycle_rules = s3_bucket.lifecycle_rules
+        response = GetBucketLifecycleConfigurationOutput(
+            Rules=lifecycle_rules,
             # TODO: remove for next major version, safe access to new attribute
             TransitionDefaultMinimumObjectSize=getattr(
                 s3_bucket,
@@ -3284,6 +3595,11 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 TransitionDefaultMinimumObjectSize.all_storage_classes_128K,
             ),
         )
+        # only publish when the rules were not concurrently replaced: put/delete rebind the rules object and
+        # pop the cache, and caching the stale response here would clobber that invalidation
+        if lifecycle_rules is s3_bucket.lifecycle_rules:
+            self._lifecycle_response_cache[bucket] = response
+        return response
 
     def put_bucket_lifecycle_configuration(
         self,
@@ -3302,10 +3618,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             or TransitionDefaultMinimumObjectSize.all_storage_classes_128K
         )
 
-        if transition_min_obj_size not in (
-            TransitionDefaultMinimumObjectSize.all_storage_classes_128K,
-            TransitionDefaultMinimumObjectSize.varies_by_storage_class,
-        ):
+        if transition_min_obj_size not in _VALID_TRANSITION_MIN_OBJECT_SIZES:
             raise InvalidRequest(
                 f"Invalid TransitionDefaultMinimumObjectSize found: {transition_min_obj_size}"
             )
@@ -3316,7 +3629,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         # for now, we keep a cache and get it everytime we fetch an object
         s3_bucket.lifecycle_rules = lifecycle_configuration["Rules"]
         s3_bucket.transition_default_minimum_object_size = transition_min_obj_size
-        self._expiration_cache[bucket].clear()
+        self._invalidate_expiration_cache(bucket)
+        self._lifecycle_response_cache.pop(bucket, None)
         return PutBucketLifecycleConfigurationOutput(
             TransitionDefaultMinimumObjectSize=transition_min_obj_size
         )
@@ -3331,7 +3645,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         store, s3_bucket = self._get_cross_account_bucket(context, bucket)
 
         s3_bucket.lifecycle_rules = None
-        self._expiration_cache[bucket].clear()
+        self._invalidate_expiration_cache(bucket)
+        self._lifecycle_response_cache.pop(bucket, None)
 
     def put_bucket_analytics_configuration(
         self,
@@ -3377,10 +3692,12 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
         return ListBucketAnalyticsConfigurationsOutput(
             IsTruncated=False,
-            AnalyticsConfigurationList=sorted(
-                s3_bucket.analytics_configurations.values(),
-                key=itemgetter("Id"),
-            ),
+            # the configurations are keyed by their Id, so sorting the keys avoids hashing each dict
+            # through an itemgetter per comparison
+            AnalyticsConfigurationList=[
+                s3_bucket.analytics_configurations[config_id]
+                for config_id in sorted(s3_bucket.analytics_configurations)
+            ],
         )
 
     def delete_bucket_analytics_configuration(
@@ -3441,10 +3758,10 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
         return ListBucketIntelligentTieringConfigurationsOutput(
             IsTruncated=False,
-            IntelligentTieringConfigurationList=sorted(
-                s3_bucket.intelligent_tiering_configurations.values(),
-                key=itemgetter("Id"),
-            ),
+            IntelligentTieringConfigurationList=[
+                s3_bucket.intelligent_tiering_configurations[config_id]
+                for config_id in sorted(s3_bucket.intelligent_tiering_configurations)
+            ],
         )
 
     def put_bucket_inventory_configuration(
@@ -3489,9 +3806,10 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
         return ListBucketInventoryConfigurationsOutput(
             IsTruncated=False,
-            InventoryConfigurationList=sorted(
-                s3_bucket.inventory_configurations.values(), key=itemgetter("Id")
-            ),
+            InventoryConfigurationList=[
+                s3_bucket.inventory_configurations[config_id]
+                for config_id in sorted(s3_bucket.inventory_configurations)
+            ],
         )
 
     def delete_bucket_inventory_configuration(
@@ -3521,6 +3839,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 "The specified bucket does not have a website configuration",
                 BucketName=bucket,
             )
+        # the stored configuration is returned as-is (zero-copy): the serializer only reads the response, and
+        # the website_hosting routes treat it as read-only. A MappingProxyType wrapper would make this explicit
+        # but the configuration is part of the pickled bucket state, which proxies would break
         return s3_bucket.website_configuration
 
     def put_bucket_website(
@@ -3610,9 +3931,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         ):
             raise MalformedXML()
 
+        # exactly one of Days/Years must be present: equal membership results (both or neither) are invalid
         if "Mode" not in default_retention or (
-            ("Days" in default_retention and "Years" in default_retention)
-            or ("Days" not in default_retention and "Years" not in default_retention)
+            ("Days" in default_retention) == ("Years" in default_retention)
         ):
             raise MalformedXML()
 
@@ -3748,11 +4069,14 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         if retention and retention["RetainUntilDate"] < datetime.datetime.now(datetime.UTC):
             # weirdly, this date is format as following: Tue Dec 31 16:00:00 PST 2019
             # it contains the timezone as PST, even if you target a bucket in Europe or Asia
-            pst_datetime = retention["RetainUntilDate"].astimezone(tz=ZoneInfo("US/Pacific"))
+            pst_datetime = retention["RetainUntilDate"].astimezone(tz=_US_PACIFIC_TZ)
+            # resolve the PST/PDT name directly from the DST offset instead of strftime's %Z formatter, which
+            # dispatches back into the tzinfo per call
+            tz_name = "PDT" if pst_datetime.dst() else "PST"
             raise InvalidArgument(
                 "The retain until date must be in the future!",
                 ArgumentName="RetainUntilDate",
-                ArgumentValue=pst_datetime.strftime("%a %b %d %H:%M:%S %Z %Y"),
+                ArgumentValue=pst_datetime.strftime(f"%a %b %d %H:%M:%S {tz_name} %Y"),
             )
 
         if (
@@ -3783,7 +4107,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         store, s3_bucket = self._get_cross_account_bucket(context, bucket)
 
         payer = request_payment_configuration.get("Payer")
-        if payer not in ["Requester", "BucketOwner"]:
+        if payer not in ("Requester", "BucketOwner"):
             raise MalformedXML()
 
         s3_bucket.payer = payer
@@ -3886,20 +4210,14 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         #  bucket configuration. See s3control
         store, s3_bucket = self._get_cross_account_bucket(context, bucket)
 
-        public_access_block_fields = {
-            "BlockPublicAcls",
-            "BlockPublicPolicy",
-            "IgnorePublicAcls",
-            "RestrictPublicBuckets",
-        }
         if not validate_dict_fields(
             public_access_block_configuration,
-            required_fields=set(),
-            optional_fields=public_access_block_fields,
+            required_fields=frozenset(),
+            optional_fields=PUBLIC_ACCESS_BLOCK_FIELDS,
         ):
             raise MalformedXML()
 
-        for field in public_access_block_fields:
+        for field in PUBLIC_ACCESS_BLOCK_FIELDS:
             if public_access_block_configuration.get(field) is None:
                 public_access_block_configuration[field] = False
 
@@ -4005,10 +4323,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 "S3 Transfer Acceleration is not supported for buckets with periods (.) in their names"
             )
 
-        if not (status := accelerate_configuration.get("Status")) or status not in (
-            "Enabled",
-            "Suspended",
-        ):
+        # the membership test already rejects a missing status; the dotted-name check above must stay first
+        # to preserve AWS error precedence
+        if (status := accelerate_configuration.get("Status")) not in ("Enabled", "Suspended"):
             raise MalformedXML()
 
         s3_bucket.accelerate_status = status
@@ -4095,14 +4412,22 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         if not (rules := replication_configuration.get("Rules")):
             raise MalformedXML()
 
+        # rules typically share the same destination, so the ARN parse and bucket lookup are deduplicated
+        # across the loop
+        dest_buckets_by_arn: dict[str, S3Bucket | None] = {}
         for rule in rules:
             if "ID" not in rule:
                 rule["ID"] = short_uid()
 
             dest_bucket_arn = rule.get("Destination", {}).get("Bucket")
-            dest_bucket_name = s3_bucket_name(dest_bucket_arn)
+            if dest_bucket_arn in dest_buckets_by_arn:
+                dest_s3_bucket = dest_buckets_by_arn[dest_bucket_arn]
+            else:
+                dest_s3_bucket = dest_buckets_by_arn[dest_bucket_arn] = store.buckets.get(
+                    s3_bucket_name(dest_bucket_arn)
+                )
             if (
-                not (dest_s3_bucket := store.buckets.get(dest_bucket_name))
+                not dest_s3_bucket
                 or not dest_s3_bucket.versioning_status == BucketVersioningStatus.Enabled
             ):
                 # according to AWS testing the same exception is raised if the bucket does not exist
@@ -4184,7 +4509,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         previous_acl = s3_object.acl
         s3_object.acl = acp
 
-        if previous_acl != acp:
+        # canned policies are shared flyweights, so an identity check skips the recursive dict comparison for
+        # the common "re-assert the same canned ACL" case
+        if acp is not previous_acl and previous_acl != acp:
             self._notify(context, s3_bucket=s3_bucket, s3_object=s3_object)
 
         # TODO: RequestCharged
@@ -4248,8 +4575,10 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         object_key = context.request.form.get("key")
 
         if "file" in form:
-            # in AWS, you can pass the file content as a string in the form field and not as a file object
-            file_data = to_bytes(form["file"])
+            # in AWS, you can pass the file content as a string in the form field and not as a file object.
+            # form fields are always str here, so encode directly instead of going through the to_bytes
+            # dispatcher; the length for policy validation falls out of the encoded bytes
+            file_data = form["file"].encode("utf-8")
             object_content_length = len(file_data)
             stream = BytesIO(file_data)
         else:
@@ -4284,26 +4613,24 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         else:
             acp = get_canned_acl(BucketCannedACL.private, owner=s3_bucket.owner)
 
-        post_system_settable_headers = [
-            "Cache-Control",
-            "Content-Type",
-            "Content-Disposition",
-            "Content-Encoding",
-        ]
+        # a single pass over the form extracts system metadata, user metadata and the encryption fields
+        # together, instead of probing the same dict across three separate traversals. The x-amz-meta- match
+        # slices at the known prefix length rather than re-scanning with removeprefix
         system_metadata = {}
-        for system_metadata_field in post_system_settable_headers:
-            if field_value := form.get(system_metadata_field):
-                system_metadata[system_metadata_field.replace("-", "")] = field_value
+        user_metadata = {}
+        encryption_request = {}
+        for field, field_value in form.items():
+            if system_metadata_field := POST_OBJECT_SYSTEM_SETTABLE_HEADERS.get(field):
+                if field_value:
+                    system_metadata[system_metadata_field] = field_value
+            elif field.startswith("x-amz-meta-"):
+                user_metadata[field[11:].lower()] = field_value
+            elif encryption_field := POST_OBJECT_ENCRYPTION_HEADERS.get(field):
+                encryption_request[encryption_field] = field_value
 
         if not system_metadata.get("ContentType"):
             system_metadata["ContentType"] = "binary/octet-stream"
 
-        user_metadata = {
-            field.removeprefix("x-amz-meta-").lower(): form.get(field)
-            for field in form
-            if field.startswith("x-amz-meta-")
-        }
-
         if tagging := form.get("tagging"):
             # this is weird, as it's direct XML in the form, we need to parse it directly
             tagging = parse_post_object_tagging_xml(tagging)
@@ -4315,12 +4642,6 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 "The storage class you specified is not valid", StorageClassRequested=storage_class
             )
 
-        encryption_request = {
-            "ServerSideEncryption": form.get("x-amz-server-side-encryption"),
-            "SSEKMSKeyId": form.get("x-amz-server-side-encryption-aws-kms-key-id"),
-            "BucketKeyEnabled": form.get("x-amz-server-side-encryption-bucket-key-enabled"),
-        }
-
         encryption_parameters = get_encryption_parameters_from_request_and_bucket(
             encryption_request,
             s3_bucket,
@@ -4368,16 +4689,23 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 
             s3_bucket.objects.set(object_key, s3_object)
 
-        # in case we are overriding an object, delete the tags entry
+        # in case we are overriding an object, delete the tags entry; setting new tagging overwrites it
+        # directly, so the pop is only needed when there is nothing to set
         key_id = get_unique_key_id(bucket, object_key, version_id)
-        store.TAGS.tags.pop(key_id, None)
         if tagging:
             store.TAGS.tags[key_id] = tagging
+        else:
+            store.TAGS.tags.pop(key_id, None)
+        # the new object replaces any previous one at this key, invalidate its cached expiration result so the
+        # Expiration header below is computed against this object
+        self._expiration_cache.pop((bucket, object_key), None)
 
         response = PostResponse()
         # hacky way to set the etag in the headers as well: two locations for one value
         response["ETagHeader"] = s3_object.quoted_etag
 
+        # fetched once, it is needed by several of the branches below
+        status_code = form.get("success_action_status")
         if redirect := form.get("success_action_redirect"):
             # we need to create the redirect, as the parser could not return the moto-calculated one
             try:
@@ -4391,9 +4719,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 response["StatusCode"] = 303
             except ValueError:
                 # If S3 cannot interpret the URL, it acts as if the field is not present.
-                response["StatusCode"] = form.get("success_action_status", 204)
+                response["StatusCode"] = status_code or 204
 
-        elif status_code := form.get("success_action_status"):
+        elif status_code:
             response["StatusCode"] = status_code
         else:
             response["StatusCode"] = 204
@@ -4406,7 +4734,9 @@ class S3Provider(S3Api, ServiceLifecycleHook):
             response["VersionId"] = s3_object.version_id
 
         if s3_object.checksum_algorithm:
-            response[f"Checksum{s3_object.checksum_algorithm.upper()}"] = s3_object.checksum_value
+            response[_checksum_header_by_algorithm[s3_object.checksum_algorithm]] = (
+                s3_object.checksum_value
+            )
             response["ChecksumType"] = ChecksumType.FULL_OBJECT
 
         if s3_bucket.lifecycle_rules:
@@ -4437,10 +4767,11 @@ class S3Provider(S3Api, ServiceLifecycleHook):
 def generate_version_id(bucket_versioning_status: str) -> str | None:
     if not bucket_versioning_status:
         return None
-    elif bucket_versioning_status.lower() == "enabled":
+    # the status is only ever stored in its canonical spelling (validated in put_bucket_versioning), so the
+    # per-call .lower() allocation is unnecessary
+    if bucket_versioning_status == BucketVersioningStatus.Enabled:
         return generate_safe_version_id()
-    else:
-        return "null"
+    return "null"
 
 
 def add_encryption_to_response(response: dict, s3_object: S3Object):
@@ -4452,6 +4783,11 @@ def add_encryption_to_response(response: dict, s3_object: S3Object):
                 response["BucketKeyEnabled"] = s3_object.bucket_key_enabled
 
 
+# EncryptionParameters is a NamedTuple (slotted, C-level field access); the SSE-C fast path always returns the
+# same values, so it can share one immutable instance
+_SSE_C_ENCRYPTION_PARAMETERS = EncryptionParameters(None, None, False)
+
+
 def get_encryption_parameters_from_request_and_bucket(
     request: PutObjectRequest | CopyObjectRequest | CreateMultipartUploadRequest,
     s3_bucket: S3Bucket,
@@ -4459,7 +4795,7 @@ def get_encryption_parameters_from_request_and_bucket(
 ) -> EncryptionParameters:
     if request.get("SSECustomerKey"):
         # we return early, because ServerSideEncryption does not apply if the request has SSE-C
-        return EncryptionParameters(None, None, False)
+        return _SSE_C_ENCRYPTION_PARAMETERS
 
     encryption = request.get("ServerSideEncryption")
     kms_key_id = request.get("SSEKMSKeyId")
@@ -4501,12 +4837,21 @@ def get_object_lock_parameters_from_bucket_and_request(
     lock_until = request.get("ObjectLockRetainUntilDate")
 
     if default_retention := s3_bucket.object_lock_default_retention:
-        lock_mode = lock_mode or default_retention.get("Mode")
-        if lock_mode and not lock_until:
-            lock_until = get_retention_from_now(
-                days=default_retention.get("Days"),
-                years=default_retention.get("Years"),
+        # the default retention only changes through PutObjectLockConfiguration, so its fields are cached on
+        # the bucket and revalidated by identity against the stored dict
+        cache = s3_bucket.default_retention_cache
+        if cache is None or cache[0] is not default_retention:
+            cache = s3_bucket.default_retention_cache = (
+                default_retention,
+                default_retention.get("Mode"),
+                default_retention.get("Days"),
+                default_retention.get("Years"),
             )
+        _, default_mode, default_days, default_years = cache
+
+        lock_mode = lock_mode or default_mode
+        if lock_mode and not lock_until:
+            lock_until = get_retention_from_now(days=default_days, years=default_years)
 
     return ObjectLockParameters(lock_until, lock_legal_status, lock_mode)
 
@@ -4518,6 +4863,13 @@ def get_part_range(s3_object: S3Object, part_number: PartNumber) -> ObjectRange:
     :param part_number: the wanted part from the S3Object
     :return: an ObjectRange used to return only a slice of an Object
     """
+    # the size and parts layout are immutable once the object is stored, so ranges are cached per part for
+    # repeated part GETs of the same object (replayed multipart downloads). The getattr default covers objects
+    # restored from persisted state
+    part_range_cache = getattr(s3_object, "part_range_cache", None)
+    if part_range_cache is not None and (part_range := part_range_cache.get(part_number)):
+        return part_range
+
     if not s3_object.parts:
         if part_number > 1:
             raise InvalidPartNumber(
@@ -4525,11 +4877,11 @@ def get_part_range(s3_object: S3Object, part_number: PartNumber) -> ObjectRange:
                 PartNumberRequested=part_number,
                 ActualPartCount=1,
             )
-        return ObjectRange(
+        part_range = ObjectRange(
             begin=0,
             end=s3_object.size - 1,
             content_length=s3_object.size,
-            content_range=f"bytes 0-{s3_object.size - 1}/{s3_object.size}",
+            content_range="bytes 0-%d/%d" % (s3_object.size - 1, s3_object.size),
         )
     elif not (part_data := s3_object.parts.get(part_number)):
         raise InvalidPartNumber(
@@ -4537,15 +4889,30 @@ def get_part_range(s3_object: S3Object, part_number: PartNumber) -> ObjectRange:
             PartNumberRequested=part_number,
             ActualPartCount=len(s3_object.parts),
         )
+    else:
+        begin, part_length = part_data
+        end = begin + part_length - 1
+        part_range = ObjectRange(
+            begin=begin,
+            end=end,
+            content_length=part_length,
+            content_range="bytes %d-%d/%d" % (begin, end, s3_object.size),
+        )
 
-    begin, part_length = part_data
-    end = begin + part_length - 1
-    return ObjectRange(
-        begin=begin,
-        end=end,
-        content_length=part_length,
-        content_range=f"bytes {begin}-{end}/{s3_object.size}",
-    )
+    if part_range_cache is None:
+        part_range_cache = s3_object.part_range_cache = {}
+    part_range_cache[part_number] = part_range
+    return part_range
+
+
+# the closed set of grant request parameters, hoisted so the per-request work is just the five dict probes
+_ACL_PERMISSION_KEYS = (
+    "GrantFullControl",
+    "GrantRead",
+    "GrantReadACP",
+    "GrantWrite",
+    "GrantWriteACP",
+)
 
 
 def get_acl_headers_from_request(
@@ -4558,21 +4925,33 @@ def get_acl_headers_from_request(
         PutObjectAclRequest,
     ],
 ) -> list[tuple[str, str]]:
-    permission_keys = [
-        "GrantFullControl",
-        "GrantRead",
-        "GrantReadACP",
-        "GrantWrite",
-        "GrantWriteACP",
-    ]
     acl_headers = [
         (permission, grant_header)
-        for permission in permission_keys
+        for permission in _ACL_PERMISSION_KEYS
         if (grant_header := request.get(permission))
     ]
     return acl_headers
 
 
+# the header-name to Permission mapping never changes, so resolve it once instead of re-deriving it from the
+# capitalization per request
+_PERMISSION_BY_GRANT_KEY = {
+    permission_key: get_permission_from_header(permission_key)
+    for permission_key in _ACL_PERMISSION_KEYS
+}
+
+
+def _acl_headers_to_grants(acl_headers: list[tuple[str, str]]) -> list[Grant]:
+    """Build the Grants from parsed ACL grant headers, shared by both access-control-policy builders"""
+    # chain.from_iterable flattens the per-header grant lists in C, without the append/extend loop
+    return list(
+        chain.from_iterable(
+            parse_grants_in_headers(_PERMISSION_BY_GRANT_KEY[permission], grantees_values)
+            for permission, grantees_values in acl_headers
+        )
+    )
+
+
 def get_access_control_policy_from_acl_request(
     request: Union[PutBucketAclRequest, PutObjectAclRequest],
     owner: Owner,
@@ -4584,17 +4963,20 @@ def get_access_control_policy_from_acl_request(
     # FIXME: this is very dirty, but the parser does not differentiate between an empty body and an empty XML node
     # errors are different depending on that data, so we need to access the context. Modifying the parser for this
     # use case seems dangerous
-    is_acp_in_body = request_body
+    # the three request shapes are evaluated once; the cascade below only tests the precomputed booleans
+    has_canned_acl = bool(canned_acl)
+    has_grant_headers = bool(acl_headers)
+    has_acp_body = bool(request_body)
 
-    if not (canned_acl or acl_headers or is_acp_in_body):
+    if not (has_canned_acl or has_grant_headers or has_acp_body):
         raise MissingSecurityHeader(
             "Your request was missing a required header", MissingHeaderName="x-amz-acl"
         )
 
-    elif canned_acl and acl_headers:
+    elif has_canned_acl and has_grant_headers:
         raise InvalidRequest("Specifying both Canned ACLs and Header Grants is not allowed")
 
-    elif (canned_acl or acl_headers) and is_acp_in_body:
+    elif (has_canned_acl or has_grant_headers) and has_acp_body:
         raise UnexpectedContent("This request does not support content")
 
     if canned_acl:
@@ -4602,13 +4984,7 @@ def get_access_control_policy_from_acl_request(
         acp = get_canned_acl(canned_acl, owner=owner)
 
     elif acl_headers:
-        grants = []
-        for permission, grantees_values in acl_headers:
-            permission = get_permission_from_header(permission)
-            partial_grants = parse_grants_in_headers(permission, grantees_values)
-            grants.extend(partial_grants)
-
-        acp = AccessControlPolicy(Owner=owner, Grants=grants)
+        acp = AccessControlPolicy(Owner=owner, Grants=_acl_headers_to_grants(acl_headers))
     else:
         acp = request.get("AccessControlPolicy")
         validate_acl_acp(acp)
@@ -4622,6 +4998,12 @@ def get_access_control_policy_from_acl_request(
     return acp
 
 
+# cache of the default canned private policy by owner ID: the vast majority of requests carry no ACL headers and
+# always resolve to the same policy for a given owner. The policy is only ever replaced on the objects, never
+# mutated in place, so sharing it is safe
+_default_private_acp_cache: dict[str, AccessControlPolicy] = {}
+
+
 def get_access_control_policy_for_new_resource_request(
     request: Union[
         PutObjectRequest, CreateMultipartUploadRequest, CopyObjectRequest, CreateBucketRequest
@@ -4633,7 +5015,11 @@ def get_access_control_policy_for_new_resource_request(
     acl_headers = get_acl_headers_from_request(request)
 
     if not (canned_acl or acl_headers):
-        return get_canned_acl(BucketCannedACL.private, owner=owner)
+        if not (acp := _default_private_acp_cache.get(owner_id := owner["ID"])):
+            acp = _default_private_acp_cache[owner_id] = get_canned_acl(
+                BucketCannedACL.private, owner=owner
+            )
+        return acp
 
     elif canned_acl and acl_headers:
         raise InvalidRequest("Specifying both Canned ACLs and Header Grants is not allowed")
@@ -4642,13 +5028,7 @@ def get_access_control_policy_for_new_resource_request(
         validate_canned_acl(canned_acl)
         return get_canned_acl(canned_acl, owner=owner)
 
-    grants = []
-    for permission, grantees_values in acl_headers:
-        permission = get_permission_from_header(permission)
-        partial_grants = parse_grants_in_headers(permission, grantees_values)
-        grants.extend(partial_grants)
-
-    return AccessControlPolicy(Owner=owner, Grants=grants)
+    return AccessControlPolicy(Owner=owner, Grants=_acl_headers_to_grants(acl_headers))
 
 
 def object_exists_for_precondition_write(s3_bucket: S3Bucket, key: ObjectKey) -> bool:
@@ -3,6 +3,7 @@ from io import RawIOBase
 from typing import IO, Iterable, Iterator, Literal, Optional
 
 from localstack.aws.api.s3 import BucketName, PartNumber
+from localstack.services.s3.constants import S3_CHUNK_SIZE
 from localstack.services.s3.models import S3Multipart, S3Object, S3Part
 from localstack.services.s3.utils import ObjectRange
 
@@ -18,15 +19,31 @@ class LimitedIterableStream(Iterable[bytes]):
         self.max_length = max_length
 
     def __iter__(self):
+        # when the underlying object supports sized reads, request exactly what is left of the range: a small
+        # ranged GET then reads and allocates only its own bytes, instead of full chunks that get sliced away
+        if read := getattr(self.iterable, "read", None):
+            while self.max_length > 0:
+                chunk = read(min(S3_CHUNK_SIZE, self.max_length))
+                if not chunk:
+                    return
+                self.max_length -= len(chunk)
+                yield chunk
+            return
+
+        # stop as soon as the limit is reached: pulling one more chunk just to notice the limit would cost an
+        # extra read of the underlying storage for every range ending on a chunk boundary
         for chunk in self.iterable:
             read = len(chunk)
-            if self.max_length - read >= 0:
+            if read < self.max_length:
                 self.max_length -= read
                 yield chunk
-            elif self.max_length == 0:
+            elif read == self.max_length:
+                self.max_length = 0
+                yield chunk
                 break
             else:
                 yield chunk[: self.max_length]
+                self.max_length = 0
                 break
 
         return
@@ -117,6 +134,14 @@ class S3StoredObject(abc.ABC, Iterable[bytes]):
     def etag(self) -> str:
         pass
 
+    @property
+    def md5_digest(self) -> bytes:
+        """
+        Raw MD5 digest of the stored content, the same hash backing `etag`. Backends keeping the raw digest around
+        can override this to avoid the hex round-trip.
+        """
+        return bytes.fromhex(self.etag)
+
     @abc.abstractmethod
     def __iter__(self) -> Iterator[bytes]:
         pass
@@ -1,6 +1,7 @@
 import base64
 import codecs
 import datetime
+import functools
 import hashlib
 import itertools
 import logging
@@ -85,6 +86,8 @@ BUCKET_NAME_REGEX = (
     + r"(^(([a-z0-9]|[a-z0-9][a-z0-9\-]*[a-z0-9])\.)*([a-z0-9]|[a-z0-9][a-z0-9\-]*[a-z0-9])$)"
 )
 
+_bucket_name_regex = re.compile(BUCKET_NAME_REGEX)
+
 TAG_REGEX = re.compile(r"^[\w\s.:/=+\-@]*$")
 
 
@@ -98,6 +101,22 @@ _s3_virtual_host_regex = re.compile(S3_VIRTUAL_HOSTNAME_REGEX)
 RFC1123 = "%a, %d %b %Y %H:%M:%S GMT"
 _gmt_zone_info = ZoneInfo("GMT")
 
+_RFC1123_DAYS = frozenset(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])
+_RFC1123_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
 
 def s3_response_handler(chain: HandlerChain, context: RequestContext, response: Response):
     """
@@ -127,11 +146,13 @@ def s3_response_handler(chain: HandlerChain, context: RequestContext, response:
         response.headers.pop("Content-Type", None)
 
 
+@functools.lru_cache(maxsize=256)
 def get_owner_for_account_id(account_id: str):
     """
     This method returns the S3 Owner from the account id. for now, this is hardcoded as it was in moto, but we can then
     extend it to return different values depending on the account ID
     See https://docs.aws.amazon.com/AmazonS3/latest/API/API_Owner.html
+    The result is cached per account id and shared between callers, and must be treated as immutable
     :param account_id: the owner account id
     :return: the Owner object containing the DisplayName and owner ID
     """
@@ -212,30 +233,34 @@ def get_s3_checksum_algorithm_from_trailing_headers(
     return checksum_algorithm[0]
 
 
-def get_s3_checksum(algorithm) -> ChecksumHash:
-    match algorithm:
-        case ChecksumAlgorithm.CRC32:
-            return S3CRC32Checksum()
+# cached factories returning streaming hashers for each supported checksum algorithm. All of them are backed by
+# native implementations (OpenSSL for hashlib, zlib for CRC32 and the botocore CRT bindings for CRC32C/CRC64NVME),
+# so dispatching through a prebuilt table keeps the per-request cost to a single dict lookup
+_checksum_hash_factories: dict[ChecksumAlgorithm, Any] = {}
 
-        case ChecksumAlgorithm.CRC32C:
-            from botocore.httpchecksum import CrtCrc32cChecksum
 
-            return CrtCrc32cChecksum()
+def _get_checksum_hash_factories() -> dict[ChecksumAlgorithm, Any]:
+    # lazily built, to defer the botocore CRT imports to the first request needing a checksum
+    from botocore.httpchecksum import CrtCrc32cChecksum, CrtCrc64NvmeChecksum
 
-        case ChecksumAlgorithm.CRC64NVME:
-            from botocore.httpchecksum import CrtCrc64NvmeChecksum
+    return {
+        ChecksumAlgorithm.CRC32: S3CRC32Checksum,
+        ChecksumAlgorithm.CRC32C: CrtCrc32cChecksum,
+        ChecksumAlgorithm.CRC64NVME: CrtCrc64NvmeChecksum,
+        ChecksumAlgorithm.SHA1: functools.partial(hashlib.sha1, usedforsecurity=False),
+        ChecksumAlgorithm.SHA256: functools.partial(hashlib.sha256, usedforsecurity=False),
+    }
 
-            return CrtCrc64NvmeChecksum()
 
-        case ChecksumAlgorithm.SHA1:
-            return hashlib.sha1(usedforsecurity=False)
+def get_s3_checksum(algorithm) -> ChecksumHash:
+    if not _checksum_hash_factories:
+        _checksum_hash_factories.update(_get_checksum_hash_factories())
 
-        case ChecksumAlgorithm.SHA256:
-            return hashlib.sha256(usedforsecurity=False)
+    if factory := _checksum_hash_factories.get(algorithm):
+        return factory()
 
-        case _:
-            # TODO: check proper error? for now validated client side, need to check server response
-            raise InvalidRequest("The value specified in the x-amz-trailer header is not supported")
+    # TODO: check proper error? for now validated client side, need to check server response
+    raise InvalidRequest("The value specified in the x-amz-trailer header is not supported")
 
 
 class S3CRC32Checksum:
@@ -300,15 +325,16 @@ def parse_range_header(range_header: str, object_size: int) -> ObjectRange | Non
     :return: ObjectRange or None if the Range header is invalid
     """
     last = object_size - 1
-    try:
-        _, rspec = range_header.split("=")
-    except ValueError:
-        return None
-    if "," in rspec:
+    _, eq_sep, rspec = range_header.partition("=")
+    if not eq_sep or "," in rspec:
         return None
 
+    begin_str, dash_sep, end_str = rspec.partition("-")
+    if not dash_sep:
+        return None
     try:
-        begin, end = [int(i) if i else None for i in rspec.split("-")]
+        begin = int(begin_str) if begin_str else None
+        end = int(end_str) if end_str else None
     except ValueError:
         # if we can't parse the Range header, S3 just treat the request as a non-range request
         return None
@@ -351,30 +377,16 @@ def parse_copy_source_range_header(copy_source_range: str, object_size: int) ->
     :return: ObjectRange
     """
     last = object_size - 1
-    try:
-        _, rspec = copy_source_range.split("=")
-    except ValueError:
-        raise InvalidArgument(
-            "The x-amz-copy-source-range value must be of the form bytes=first-last where first and last are the zero-based offsets of the first and last bytes to copy",
-            ArgumentName="x-amz-copy-source-range",
-            ArgumentValue=copy_source_range,
-        )
-    if "," in rspec:
-        raise InvalidArgument(
-            "The x-amz-copy-source-range value must be of the form bytes=first-last where first and last are the zero-based offsets of the first and last bytes to copy",
-            ArgumentName="x-amz-copy-source-range",
-            ArgumentValue=copy_source_range,
-        )
-
-    try:
-        begin, end = [int(i) if i else None for i in rspec.split("-")]
-    except ValueError:
-        # if we can't parse the Range header, S3 just treat the request as a non-range request
-        raise InvalidArgument(
-            "The x-amz-copy-source-range value must be of the form bytes=first-last where first and last are the zero-based offsets of the first and last bytes to copy",
-            ArgumentName="x-amz-copy-source-range",
-            ArgumentValue=copy_source_range,
-        )
+    # parsed with partition (no intermediate lists) and a single shared rejection path
+    _, eq_sep, rspec = copy_source_range.partition("=")
+    begin_str, dash_sep, end_str = rspec.partition("-")
+    begin = end = None
+    if eq_sep and dash_sep and "," not in rspec:
+        try:
+            begin = int(begin_str) if begin_str else None
+            end = int(end_str) if end_str else None
+        except ValueError:
+            pass
 
     if begin is None or end is None or begin > end:
         raise InvalidArgument(
@@ -432,15 +444,16 @@ def base_64_content_md5_to_etag(content_md5: ContentMD5) -> str | None:
     :return: the ETag value, hex coded MD5 digest, or None if the input is not valid b64 or the representation of a MD5
     hash
     """
-    if not is_base64(content_md5):
+    # a base64-encoded MD5 digest is always exactly 24 characters, so reject other lengths before paying for
+    # the full base64 validation and decode
+    if len(content_md5) != 24 or not is_base64(content_md5):
         return None
     # get the hexdigest from the bytes digest
     byte_digest = base64.b64decode(content_md5)
-    hex_digest = to_str(codecs.encode(byte_digest, "hex"))
-    if len(hex_digest) != 32:
+    if len(byte_digest) != 16:
         return None
 
-    return hex_digest
+    return byte_digest.hex()
 
 
 def is_presigned_url_request(context: RequestContext) -> bool:
@@ -460,7 +473,7 @@ def is_bucket_name_valid(bucket_name: str) -> bool:
     """
     ref. https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucketnamingrules.html
     """
-    return True if re.match(BUCKET_NAME_REGEX, bucket_name) else False
+    return True if _bucket_name_regex.match(bucket_name) else False
 
 
 def get_permission_header_name(permission: Permission) -> str:
@@ -497,18 +510,17 @@ def uses_host_addressing(headers: Dict[str, str]) -> str | None:
         return bucket_name
 
 
-def get_class_attrs_from_spec_class(spec_class: type[StrEnum]) -> set[str]:
-    return {str(spec) for spec in spec_class}
+def get_class_attrs_from_spec_class(spec_class: type[StrEnum]) -> frozenset[str]:
+    return frozenset(str(spec) for spec in spec_class)
 
 
 def get_system_metadata_from_request(request: dict) -> Metadata:
-    metadata: Metadata = {}
-
-    for system_metadata_field in SYSTEM_METADATA_SETTABLE_HEADERS:
-        if field_value := request.get(system_metadata_field):
-            metadata[system_metadata_field] = field_value
-
-    return metadata
+    # built as a single comprehension over the shared key tuple, so the per-request cost is one dict allocation
+    return {
+        system_metadata_field: field_value
+        for system_metadata_field in SYSTEM_METADATA_SETTABLE_HEADERS
+        if (field_value := request.get(system_metadata_field))
+    }
 
 
 def forwarded_from_virtual_host_addressed_request(headers: dict[str, str]) -> bool:
@@ -678,6 +690,32 @@ def rfc_1123_datetime(src: datetime.datetime) -> str:
 
 
 def str_to_rfc_1123_datetime(value: str) -> datetime.datetime:
+    # RFC 1123 dates have a fixed width (e.g. `Sun, 06 Nov 1994 08:49:37 GMT`), so we can slice the fields directly
+    # instead of going through strptime, which rebuilds its format parse tree on every call. The separators are
+    # checked as well, so malformed 29-character values keep taking the strict strptime fallback below
+    try:
+        if (
+            len(value) == 29
+            and value.endswith(" GMT")
+            and value[3:5] == ", "
+            and value[7] == value[11] == value[16] == " "
+            and value[19] == value[22] == ":"
+            and value[:3] in _RFC1123_DAYS
+            and (month := _RFC1123_MONTHS.get(value[8:11]))
+        ):
+            return datetime.datetime(
+                int(value[12:16]),
+                month,
+                int(value[5:7]),
+                int(value[17:19]),
+                int(value[20:22]),
+                int(value[23:25]),
+                tzinfo=_gmt_zone_info,
+            )
+    except ValueError:
+        # fields did not parse as integers or were out of range, let strptime raise the proper error below
+        pass
+
     return datetime.datetime.strptime(value, RFC1123).replace(tzinfo=_gmt_zone_info)
 
 
@@ -949,16 +987,28 @@ def validate_failed_precondition(
         )
 
 
+# flyweight cache of canned ACL policies: the same (canned ACL, owner) pair always resolves to the same policy, and
+# sharing it avoids allocating a Grants list per object. The cached policies are only ever replaced on the objects
+# holding them, never mutated in place, so they must be treated as immutable. A plain dict is used instead of
+# MappingProxyType, as the policies end up on S3Object/S3Bucket instances which need to stay picklable
+_canned_acl_cache: dict[tuple[str, str, Optional[str]], AccessControlPolicy] = {}
+
+
 def get_canned_acl(
     canned_acl: BucketCannedACL | ObjectCannedACL, owner: Owner
 ) -> AccessControlPolicy:
     """
     Return the proper Owner and Grants from a CannedACL
     See https://docs.aws.amazon.com/AmazonS3/latest/userguide/acl-overview.html#canned-acl
+    The returned policy is cached and shared between callers, and must be treated as immutable
     :param canned_acl: an S3 CannedACL
     :param owner: the current owner of the bucket or object
     :return: an AccessControlPolicy containing the Grants and Owner
     """
+    cache_key = (canned_acl, owner["ID"], owner.get("DisplayName"))
+    if acp := _canned_acl_cache.get(cache_key):
+        return acp
+
     owner_grantee = Grantee(**owner, Type=GranteeType.CanonicalUser)
     grants = [Grant(Grantee=owner_grantee, Permission=Permission.FULL_CONTROL)]
 
@@ -985,7 +1035,8 @@ def get_canned_acl(
             grants.append(Grant(Grantee=LOG_DELIVERY_ACL_GRANTEE, Permission=Permission.READ_ACP))
             grants.append(Grant(Grantee=LOG_DELIVERY_ACL_GRANTEE, Permission=Permission.WRITE))
 
-    return AccessControlPolicy(Owner=owner, Grants=grants)
+    acp = _canned_acl_cache[cache_key] = AccessControlPolicy(Owner=owner, Grants=grants)
+    return acp
 
 
 def create_redirect_for_post_request(
@@ -46,7 +46,6 @@ from localstack.services.s3.utils import (
     validate_dict_fields,
 )
 from localstack.utils.aws import arns
-from localstack.utils.strings import to_bytes
 
 # https://docs.aws.amazon.com/AmazonS3/latest/userguide/acl-overview.html#canned-acl
 # bucket-owner-read + bucket-owner-full-control are allowed, but ignored for buckets
@@ -415,7 +414,12 @@ def validate_object_key(object_key: str) -> None:
     ref. https://docs.aws.amazon.com/AmazonS3/latest/userguide/object-keys.html
 
     """
-    if (len_key := len(to_bytes(object_key, encoding="UTF-8"))) > 1024:
+    # the limit applies to the UTF-8 encoded key. For ASCII keys (by far the most common case) the string length
+    # already is the byte length, so we can skip the encoding pass entirely
+    if len(object_key) <= 1024 and object_key.isascii():
+        return
+
+    if (len_key := len(object_key.encode("utf-8"))) > 1024:
         raise KeyTooLongError(
             "Your key is too long",
             MaxSizeAllowed="1024",
@@ -29,6 +29,10 @@ class TaggingService:
         for t in tags:
             self.tags[arn][t[self.key_field]] = t[self.value_field]
 
+    def set_tags(self, arn: str, tags: List[Dict[str, str]]):
+        """Replace all tags of the resource with the given tag list, instead of merging into existing ones."""
+        self.tags[arn] = {t[self.key_field]: t[self.value_field] for t in tags}
+
     def untag_resource(self, arn: str, tag_names: List[str]):
         tags = self.tags.get(arn, {})
         for name in tag_names:
@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 import os
 import re
 import string
@@ -19,6 +20,7 @@ from localstack.services.s3.codec import AwsChunkedDecoder
 from localstack.services.s3.constants import S3_CHUNK_SIZE
 from localstack.services.s3.exceptions import MalformedXML
 from localstack.services.s3.models import S3Multipart, S3Object, S3Part
+from localstack.services.s3.provider import S3Provider
 from localstack.services.s3.storage.ephemeral import EphemeralS3ObjectStore
 from localstack.services.s3.validation import validate_canned_acl
 
@@ -571,10 +573,12 @@ class TestS3AwsChunkedDecoder:
         assert stream.read() == total_body
 
         stream = AwsChunkedDecoder(BytesIO(encoded_data), decoded_content_length)
-        # assert that even if we read more than a chunk size, we will get max chunk_size
-        assert stream.read(chunk_size + 1000) == total_body[:chunk_size]
-        # assert that even if we read more, when accessing the rest, we're still at the same position
-        assert stream.read(10) == total_body[chunk_size : chunk_size + 10]
+        # assert that reading more than a chunk size decodes across chunk boundaries and returns the full
+        # requested amount
+        read_size = chunk_size + 1000
+        assert stream.read(read_size) == total_body[:read_size]
+        # assert that the position is kept when accessing the rest of the stream
+        assert stream.read(10) == total_body[read_size : read_size + 10]
 
     def test_s3_aws_chunked_decoder_access_trailing(self):
         body = "Hello\r\n\r\n\r\n\r\n"
@@ -614,10 +618,12 @@ class TestS3AwsChunkedDecoder:
         assert stream.read() == total_body
 
         stream = AwsChunkedDecoder(BytesIO(encoded_data), decoded_content_length)
-        # assert that even if we read more than a chunk size, we will get max chunk_size
-        assert stream.read(chunk_size + 1000) == total_body[:chunk_size]
-        # assert that even if we read more, when accessing the rest, we're still at the same position
-        assert stream.read(10) == total_body[chunk_size : chunk_size + 10]
+        # assert that reading more than a chunk size decodes across chunk boundaries and returns the full
+        # requested amount
+        read_size = chunk_size + 1000
+        assert stream.read(read_size) == total_body[:read_size]
+        # assert that the position is kept when accessing the rest of the stream
+        assert stream.read(10) == total_body[read_size : read_size + 10]
 
 
 class TestS3TemporaryStorageBackend:
@@ -726,3 +732,47 @@ class TestS3VersionIdGenerator:
         for index, version_id in enumerate(version_ids[1:]):
             previous_version = version_ids[index]
             assert s3_utils.is_version_older_than_other(previous_version, version_id)
+
+
+class TestS3PutObjectStreamingBody:
+    def test_put_object_does_not_access_request_data(self, tmpdir):
+        """
+        Guard for the streaming PUT path: accessing `context.request.data` materializes (and caches) the whole
+        upload body in memory, which can be gigabytes for chunked uploads. `put_object` must only ever consume
+        the streaming `Body` from the service request, so any access to `request.data` during the call fails
+        this test.
+        """
+
+        class StreamingOnlyRequest(Request):
+            @property
+            def data(self) -> bytes:
+                raise AssertionError(
+                    "put_object must not access request.data, the body must only be consumed as a stream"
+                )
+
+        provider = S3Provider(storage_backend=EphemeralS3ObjectStore(root_directory=str(tmpdir)))
+        try:
+            create_context = RequestContext(Request(method="PUT", path="/"))
+            create_context.account_id = "000000000000"
+            create_context.region = "us-east-1"
+            provider.create_bucket(create_context, request={"Bucket": "test-streaming-bucket"})
+
+            put_context = RequestContext(
+                StreamingOnlyRequest(method="PUT", path="/test-streaming-bucket/test-key")
+            )
+            put_context.account_id = "000000000000"
+            put_context.region = "us-east-1"
+
+            body = b"streamed body"
+            response = provider.put_object(
+                put_context,
+                request={
+                    "Bucket": "test-streaming-bucket",
+                    "Key": "test-key",
+                    "Body": BytesIO(body),
+                },
+            )
+            # the object was fully stored through the streaming path
+            assert response["ETag"] == f'"{hashlib.md5(body).hexdigest()}"'
+        finally:
+            provider.on_before_stop()